@@ -12,20 +12,25 @@ Space toggles between Region <-> Window mode during capture.
 
 import sys
 import os
+import importlib
+import time
 import webbrowser
 from dataclasses import dataclass
 from enum import Enum
 from PyQt5.QtWidgets import (
     QSystemTrayIcon, QMenu, QApplication, QMessageBox, QDialog, QAction
 )
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
-from PyQt5.QtCore import Qt, QTimer, QRect, QThread, pyqtSignal, QAbstractNativeEventFilter
+from PyQt5.QtGui import QIcon, QImage, QPixmap, QPixmapCache, QPainter, QColor, QFont
+from PyQt5.QtCore import (
+    Qt, QTimer, QRect, QThread, pyqtSignal, QAbstractNativeEventFilter,
+    QObject, QRunnable, QThreadPool
+)
 
 from config import config
 from logger import log
 from ocr_dialog import OcrResultDialog
 from safe_io import MAX_IMAGE_DIMENSION, MAX_IMAGE_PIXELS, load_image
-from utils import pil_to_qpixmap
+from utils import pil_to_qimage, pil_to_qpixmap
 
 
 class _SystemThemeFilter(QAbstractNativeEventFilter):
@@ -54,10 +59,133 @@ class _SystemThemeFilter(QAbstractNativeEventFilter):
         return False, 0
 
 
+def _icon_candidates():
+    candidates = []
+    if getattr(sys, 'frozen', False):
+        exe_dir = os.path.dirname(sys.executable)
+        candidates.append(os.path.join(exe_dir, "swiftshot.ico"))
+        candidates.append(os.path.join(exe_dir, "swiftshot.png"))
+        meipass = getattr(sys, '_MEIPASS', None)
+        if meipass:
+            candidates.append(os.path.join(meipass, "swiftshot.ico"))
+            candidates.append(os.path.join(meipass, "swiftshot.png"))
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    candidates.append(os.path.join(script_dir, "swiftshot.ico"))
+    candidates.append(os.path.join(script_dir, "swiftshot.png"))
+    return tuple(candidates)
+
+
+# Bundled icon locations, in priority order. Resolved once at import.
+_ICON_CANDIDATES = _icon_candidates()
+# Rendered fallback icon, written on the first source-mode start without a
+# bundled icon so later starts load a PNG instead of painting it again.
+_GENERATED_ICON_NAME = "generated_icon.png"
+_PIXMAP_CACHE_LIMIT_KB = 100 * 1024
+
+
+_lazy_attrs = {}
+
+
+def _lazy_attr(module_name, name):
+    """Import ``module_name.name`` on first use and keep the reference.
+
+    Capture modules are imported late to keep tray startup fast; caching
+    them here stops every hotkey press from re-running the import statement
+    (import lock plus ``sys.modules`` lookup) on the hot path.
+    """
+    key = (module_name, name)
+    value = _lazy_attrs.get(key)
+    if value is None:
+        value = getattr(importlib.import_module(module_name), name)
+        _lazy_attrs[key] = value
+    return value
+
+
+def _capture_manager():
+    return _lazy_attr("capture", "CaptureManager")
+
+
+def _capture_worker_class():
+    return _lazy_attr("capture", "CaptureWorker")
+
+
+def _region_selector():
+    return _lazy_attr("overlay", "RegionSelector")
+
+
+def _window_picker_class():
+    return _lazy_attr("window_picker", "WindowPicker")
+
+
+def _countdown_overlay():
+    return _lazy_attr("countdown_overlay", "CountdownOverlay")
+
+
+def _image_editor():
+    return _lazy_attr("editor", "ImageEditor")
+
+
+def _draw_fallback_icon():
+    """Paint the 64x64 SwiftShot tray icon used when no icon file exists."""
+    pixmap = QPixmap(64, 64)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setBrush(QColor("#89b4fa"))
+    painter.setPen(Qt.NoPen)
+    painter.drawRoundedRect(4, 4, 56, 56, 12, 12)
+    painter.setBrush(QColor("#1e1e2e"))
+    painter.drawRoundedRect(12, 18, 40, 30, 4, 4)
+    painter.setBrush(QColor("#89b4fa"))
+    painter.drawEllipse(24, 22, 16, 16)
+    painter.setBrush(QColor("#1e1e2e"))
+    painter.drawEllipse(28, 26, 8, 8)
+    painter.setBrush(QColor("#f9e2af"))
+    painter.drawRect(16, 21, 6, 3)
+    painter.setPen(QColor("#cdd6f4"))
+    painter.setFont(QFont("Segoe UI", 7, QFont.Bold))
+    painter.drawText(22, 56, "SS")
+    painter.end()
+    return pixmap
+
+
+# Modules behind the capture hotkeys, imported on the thread pool at startup
+# so the first PrintScreen does not pay for them.
+_WARM_IMPORT_MODULES = ("capture", "overlay", "window_picker",
+                        "countdown_overlay", "editor")
+
+
+def _warm_imports():
+    for module_name in _WARM_IMPORT_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # The real import on first use reports the failure.
+            log.debug(f"Warm import of {module_name} failed", exc_info=True)
+
+
+def _disconnect_all(*signals):
+    """Drop every slot connected to ``signals``.
+
+    Capture-surface slots are lambdas bound to the surface itself, so the
+    connection keeps the widget (and its desktop-sized screenshot) alive
+    until it is cut.
+    """
+    for signal in signals:
+        try:
+            signal.disconnect()
+        except TypeError:
+            pass
+
+
 def _load_file_pixmap(path):
     return pil_to_qpixmap(load_image(path))
 
 
+def _load_file_image(path):
+    return pil_to_qimage(load_image(path))
+
+
 def _pixmap_within_safe_limits(pixmap):
     if pixmap is None or pixmap.isNull():
         return False
@@ -107,14 +235,104 @@ class _OcrWorker(QThread):
                     pass
 
 
+class _TaskSignals(QObject):
+    """Result signals for a QRunnable (which is not a QObject itself)."""
+
+    done = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _HistorySaveTask(QRunnable):
+    """Encode, hash and index a capture in history on the global thread pool.
+
+    The full-resolution PNG encode (zlib) used to run inline before the
+    editor/clipboard actions. QPixmap is GUI-thread only, so the task is
+    handed a QImage converted on the GUI thread.
+    """
+
+    def __init__(self, image):
+        super().__init__()
+        self._image = image
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            from capture_history import save_to_history
+            # Saved path, or None when history refused the capture.
+            self.signals.done.emit(save_to_history(self._image, ""))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _ImageLoadTask(QRunnable):
+    """Decode an image file on the global thread pool. Emits a QImage; the
+    GUI thread only pays the QImage -> QPixmap upload."""
+
+    def __init__(self, path):
+        super().__init__()
+        self._path = path
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            self.signals.done.emit(_load_file_image(self._path))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+# After-capture workflow action -> SwiftShotApp handler method name.
+_AFTER_CAPTURE_HANDLERS = {
+    "editor": "_open_editor",
+    "save": "_save_directly",
+    "clipboard": "_copy_to_clipboard",
+}
+
+
+# Tray context menu, top to bottom: (label, slot name, hotkey config key)
+# or None for a separator. Exit is appended separately so update actions can
+# be inserted above it.
+_TRAY_MENU_SPEC = (
+    ("Capture Menu", "show_capture_menu", "CAPTURE_REGION_HOTKEY"),
+    None,
+    ("Capture Region", "capture_region", None),
+    ("Capture Window", "capture_window", "CAPTURE_WINDOW_HOTKEY"),
+    ("Capture Full Screen", "capture_fullscreen", "CAPTURE_FULLSCREEN_HOTKEY"),
+    ("Capture Last Region", "capture_last_region", "CAPTURE_LAST_REGION_HOTKEY"),
+    None,
+    ("Region (Freehand)", "capture_freehand", "CAPTURE_FREEHAND_HOTKEY"),
+    ("OCR Region", "capture_ocr", "CAPTURE_OCR_HOTKEY"),
+    ("Scrolling Capture...", "capture_scrolling", "CAPTURE_SCROLLING_HOTKEY"),
+    None,
+    ("Open Image from File...", "open_from_file", None),
+    ("Open Image from Clipboard", "open_from_clipboard", None),
+    None,
+    ("Capture History...", "show_history", None),
+    None,
+    ("Preferences...", "show_settings", None),
+    None,
+    ("About SwiftShot", "show_about", None),
+    ("Export Diagnostics...", "export_diagnostics", None),
+)
+
+
 class SwiftShotApp:
     """Main application controller."""
 
+    # Icon file that _load_ico_file resolved; skips the candidate scan when
+    # the controller is rebuilt in the same process.
+    _cached_icon_path = None
+    # In-memory icon drawn when no icon file exists and the generated PNG
+    # could not be written or read back.
+    _fallback_icon = None
+
     def __init__(self, app: QApplication):
         self.app = app
         self.tray_icon = None
         self.editors = []
         self._overlay = None
+        self._region_selector_pool = None   # closed overlay kept for reuse
+        self._countdown_pool = None         # countdown badge kept for reuse
+        self._known_dirs = set()            # save folders already created
         self._window_picker = None
         self._hotkey_listener = None
         self._pin_windows = []
@@ -131,12 +349,29 @@ class SwiftShotApp:
         self._tray_menu = None
         self._exit_action = None
         self._ocr_workers = []      # keep async OCR threads alive until done
+        self._capture_workers = []  # keep desktop-grab threads alive until done
+        self._pool_tasks = []       # keep thread-pool task signals alive
+        self._screens = None        # QScreen tuple, refreshed on topology change
         self._capture_generation = 0
         self._capture_menu_generation = 0
+        self._last_region = None     # (LAST_REGION string, parsed QRect)
         self._scrolling_dialog = None
         self._recovery_prompted = set()
 
     def start(self):
+        # History thumbnails are cached as pixmaps across dialog openings;
+        # Qt's 10 MB default evicts them after ~150 cards.
+        QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+
+        # Screen topology only changes on these signals; captures read the
+        # cached tuple instead of asking Qt on every hotkey press.
+        self.app.screenAdded.connect(lambda _screen: self._refresh_screens())
+        self.app.screenRemoved.connect(
+            lambda screen: self._refresh_screens(removed=screen))
+        self.app.primaryScreenChanged.connect(
+            lambda _screen: self._refresh_screens())
+        self._refresh_screens()
+
         # Set app-wide icon so every QWidget/QDialog inherits it
         app_icon = self._create_app_icon()
         self.app.setWindowIcon(app_icon)
@@ -188,6 +423,10 @@ class SwiftShotApp:
         if config.CHECK_FOR_UPDATES:
             self._check_for_updates()
 
+        # Python's import lock makes this safe off the GUI thread; these
+        # modules only define classes at import time.
+        QThreadPool.globalInstance().start(QRunnable.create(_warm_imports))
+
         log.info("SwiftShot started successfully")
 
     def _check_history_health(self):
@@ -255,7 +494,7 @@ class SwiftShotApp:
         return "later"
 
     def _restore_recovery_entry(self, entry):
-        from editor import ImageEditor
+        ImageEditor = _image_editor()
         editor = ImageEditor(swiftshot_app=self)
         if not editor.restore_recovery(entry.path):
             editor._set_dirty(False)
@@ -302,7 +541,7 @@ class SwiftShotApp:
             from updater import UpdateChecker
             self._update_checker = UpdateChecker()
             self._update_checker.update_available.connect(self._on_update_available)
-            self._update_checker.start()
+            self._update_checker.check()
         except Exception as e:
             log.warning(f"Could not start update checker: {e}")
 
@@ -355,97 +594,59 @@ class SwiftShotApp:
         if icon and not icon.isNull():
             return icon
 
-        # Fallback: draw it in memory (dev/source mode)
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QColor("#89b4fa"))
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(4, 4, 56, 56, 12, 12)
-        painter.setBrush(QColor("#1e1e2e"))
-        painter.drawRoundedRect(12, 18, 40, 30, 4, 4)
-        painter.setBrush(QColor("#89b4fa"))
-        painter.drawEllipse(24, 22, 16, 16)
-        painter.setBrush(QColor("#1e1e2e"))
-        painter.drawEllipse(28, 26, 8, 8)
-        painter.setBrush(QColor("#f9e2af"))
-        painter.drawRect(16, 21, 6, 3)
-        painter.setPen(QColor("#cdd6f4"))
-        painter.setFont(QFont("Segoe UI", 7, QFont.Bold))
-        painter.drawText(22, 56, "SS")
-        painter.end()
-        return QIcon(pixmap)
+        generated = os.path.join(config.config_dir, _GENERATED_ICON_NAME)
+        if os.path.isfile(generated):
+            icon = QIcon(generated)
+            if not icon.isNull():
+                SwiftShotApp._cached_icon_path = generated
+                return icon
+
+        # Fallback: draw it in memory (dev/source mode), once per process.
+        if SwiftShotApp._fallback_icon is None:
+            pixmap = _draw_fallback_icon()
+            if not pixmap.save(generated, "PNG"):
+                log.debug(f"Could not cache the generated icon at {generated}")
+            SwiftShotApp._fallback_icon = QIcon(pixmap)
+        return SwiftShotApp._fallback_icon
 
     def _load_ico_file(self):
         """Try to locate swiftshot.ico or .png from standard locations."""
-        candidates = []
-        if getattr(sys, 'frozen', False):
-            exe_dir = os.path.dirname(sys.executable)
-            candidates.append(os.path.join(exe_dir, "swiftshot.ico"))
-            candidates.append(os.path.join(exe_dir, "swiftshot.png"))
-            meipass = getattr(sys, '_MEIPASS', None)
-            if meipass:
-                candidates.append(os.path.join(meipass, "swiftshot.ico"))
-                candidates.append(os.path.join(meipass, "swiftshot.png"))
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        candidates.append(os.path.join(script_dir, "swiftshot.ico"))
-        candidates.append(os.path.join(script_dir, "swiftshot.png"))
-
-        for path in candidates:
+        cached = SwiftShotApp._cached_icon_path
+        if cached:
+            icon = QIcon(cached)
+            if not icon.isNull():
+                return icon
+            SwiftShotApp._cached_icon_path = None
+
+        for path in _ICON_CANDIDATES:
             if os.path.isfile(path):
                 icon = QIcon(path)
                 if not icon.isNull():
+                    SwiftShotApp._cached_icon_path = path
                     return icon
         return None
 
     def _create_tray_icon(self):
-        from theme import stylesheet_for_theme
-
         self.tray_icon = QSystemTrayIcon(self.app.windowIcon(), self.app)
 
+        # No per-menu stylesheet: apply_theme already set it on the
+        # QApplication and the menu inherits it.
         menu = QMenu()
-        menu.setStyleSheet(stylesheet_for_theme(config.THEME))
 
         # Hotkey columns are refreshed from live config via
         # _refresh_tray_hotkey_labels — hardcoded shortcuts lie after a rebind.
         self._tray_hotkey_actions = {}
-        act = menu.addAction("Capture Menu")
-        act.triggered.connect(self.show_capture_menu)
-        self._tray_hotkey_actions[("Capture Menu", "CAPTURE_REGION_HOTKEY")] = act
-        menu.addSeparator()
-        menu.addAction("Capture Region").triggered.connect(self.capture_region)
-        act = menu.addAction("Capture Window")
-        act.triggered.connect(self.capture_window)
-        self._tray_hotkey_actions[("Capture Window", "CAPTURE_WINDOW_HOTKEY")] = act
-        act = menu.addAction("Capture Full Screen")
-        act.triggered.connect(self.capture_fullscreen)
-        self._tray_hotkey_actions[("Capture Full Screen", "CAPTURE_FULLSCREEN_HOTKEY")] = act
-        act = menu.addAction("Capture Last Region")
-        act.triggered.connect(self.capture_last_region)
-        self._tray_hotkey_actions[("Capture Last Region", "CAPTURE_LAST_REGION_HOTKEY")] = act
-        menu.addSeparator()
-        act = menu.addAction("Region (Freehand)")
-        act.triggered.connect(self.capture_freehand)
-        self._tray_hotkey_actions[("Region (Freehand)", "CAPTURE_FREEHAND_HOTKEY")] = act
-        act = menu.addAction("OCR Region")
-        act.triggered.connect(self.capture_ocr)
-        self._tray_hotkey_actions[("OCR Region", "CAPTURE_OCR_HOTKEY")] = act
-        act = menu.addAction("Scrolling Capture...")
-        act.triggered.connect(self.capture_scrolling)
-        self._tray_hotkey_actions[("Scrolling Capture...", "CAPTURE_SCROLLING_HOTKEY")] = act
+        for entry in _TRAY_MENU_SPEC:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, slot, hotkey_key = entry
+            act = menu.addAction(label)
+            act.triggered.connect(getattr(self, slot))
+            if hotkey_key:
+                self._tray_hotkey_actions[(label, hotkey_key)] = act
         self._refresh_tray_hotkey_labels()
         menu.addSeparator()
-        menu.addAction("Open Image from File...").triggered.connect(self.open_from_file)
-        menu.addAction("Open Image from Clipboard").triggered.connect(self.open_from_clipboard)
-        menu.addSeparator()
-        menu.addAction("Capture History...").triggered.connect(self.show_history)
-        menu.addSeparator()
-        menu.addAction("Preferences...").triggered.connect(self.show_settings)
-        menu.addSeparator()
-        menu.addAction("About SwiftShot").triggered.connect(self.show_about)
-        menu.addAction("Export Diagnostics...").triggered.connect(self.export_diagnostics)
-        menu.addSeparator()
         self._exit_action = menu.addAction("Exit")
         self._exit_action.triggered.connect(self.exit_app)
 
@@ -561,9 +762,9 @@ class SwiftShotApp:
     # -------------------------------------------------------------------
 
     def _supersede_countdown(self):
-        """Cancel any in-flight countdown before starting a new one. The single
-        self._countdown slot holds the only reference, so overwriting it would
-        GC the widget mid-count and its capture would never fire, silently."""
+        """Cancel any in-flight countdown before starting a new one. The badge
+        is reused, so re-arming it mid-count would silently drop the earlier
+        capture without logging or emitting cancelled."""
         prev = getattr(self, "_countdown", None)
         if prev is not None:
             try:
@@ -573,6 +774,22 @@ class SwiftShotApp:
                 pass
             self._countdown = None
 
+    def _acquire_countdown(self, total_ms):
+        """Return the reusable countdown badge, re-armed for ``total_ms``.
+
+        Callers supersede the previous countdown first; its slots are cut
+        here so a reused badge never fires an older capture's callback.
+        """
+        overlay = getattr(self, "_countdown_pool", None)
+        if overlay is None:
+            CountdownOverlay = _countdown_overlay()
+            overlay = CountdownOverlay(total_ms)
+            self._countdown_pool = overlay
+        else:
+            _disconnect_all(overlay.countdown_finished, overlay.cancelled)
+            overlay.reset(total_ms)
+        return overlay
+
     def _capture_is_current(self, generation):
         return generation == self._capture_generation
 
@@ -609,8 +826,7 @@ class SwiftShotApp:
         delay = config.CAPTURE_DELAY_MS
         if delay > 0:
             try:
-                from countdown_overlay import CountdownOverlay
-                overlay = CountdownOverlay(delay)
+                overlay = self._acquire_countdown(delay)
                 overlay.countdown_finished.connect(
                     lambda g=generation, cb=callback:
                         self._run_capture_callback(g, cb)
@@ -618,7 +834,7 @@ class SwiftShotApp:
                 overlay.cancelled.connect(
                     lambda g=generation, o=overlay: self._cancel_capture(g, o)
                 )
-                self._countdown = overlay  # prevent GC
+                self._countdown = overlay
                 overlay.start()
             except Exception as e:
                 log.error(f"Countdown overlay failed: {e}")
@@ -634,6 +850,53 @@ class SwiftShotApp:
                     self._run_capture_callback(g, cb),
             )
 
+    def _refresh_screens(self, removed=None):
+        # screenRemoved can fire while Qt still lists the outgoing screen.
+        self._screens = tuple(
+            s for s in QApplication.screens() if s is not removed)
+
+    def _current_screens(self):
+        if self._screens is None:
+            self._refresh_screens()
+        return self._screens
+
+    def _grab_desktop(self, on_ready, failure_message):
+        """Grab the desktop on a CaptureWorker and call ``on_ready(pixmap)``
+        on the GUI thread, unless the capture was superseded meanwhile. The
+        event loop keeps running during the native blit instead of freezing
+        the tray and delaying the overlay."""
+        generation = self._capture_generation
+        try:
+            CaptureWorker = _capture_worker_class()
+            worker = CaptureWorker(len(self._current_screens()))
+            worker.image_ready.connect(
+                lambda image, g=generation, cb=on_ready, m=failure_message:
+                    self._on_full_ready(image, g, cb, m)
+            )
+            worker.finished.connect(
+                lambda w=worker: self._capture_workers.remove(w)
+                if w in self._capture_workers else None)
+            self._capture_workers.append(worker)
+            worker.start()
+        except Exception as e:
+            log.error(f"Desktop grab worker failed to start: {e}")
+            self._capture_failed(failure_message)
+
+    def _on_full_ready(self, image, generation, on_ready, failure_message):
+        if not self._capture_is_current(generation):
+            return
+        try:
+            CaptureManager = _capture_manager()
+            full = CaptureManager.desktop_pixmap(image)
+        except Exception as e:
+            log.error(f"Desktop grab conversion failed: {e}")
+            full = None
+        if not full:
+            log.warning("Desktop grab returned no image")
+            self._capture_failed(failure_message)
+            return
+        on_ready(full)
+
     # -------------------------------------------------------------------
     # Capture Menu (PrintScreen popup)
     # -------------------------------------------------------------------
@@ -641,8 +904,10 @@ class SwiftShotApp:
     def show_capture_menu(self):
         self._capture_menu_generation += 1
         generation = self._capture_menu_generation
+        # Post to the next event-loop pass so the keyboard hook returns
+        # first; a fixed 50 ms sleep only added latency to every PrintScreen.
         QTimer.singleShot(
-            50, lambda: self._do_show_capture_menu(generation)
+            0, lambda: self._do_show_capture_menu(generation)
         )
 
     def _do_show_capture_menu(self, generation=None):
@@ -675,15 +940,32 @@ class SwiftShotApp:
         self._capture_with_delay(lambda: self._do_capture_monitor(index))
 
     def _do_capture_monitor(self, index):
+        if index == -1:
+            self._grab_desktop(
+                lambda screenshot: self._finish_monitor_capture(-1, screenshot),
+                "SwiftShot could not read the desktop. Verify that the "
+                "screens are connected and try again.")
+            return
         try:
-            from capture import CaptureManager
-            if index == -1:
-                screenshot = CaptureManager.capture_fullscreen()
-            else:
-                screenshot = CaptureManager.capture_monitor(index)
+            CaptureManager = _capture_manager()
+            screens = self._current_screens()
+            screen = screens[index] if 0 <= index < len(screens) else None
+            screenshot = CaptureManager.capture_monitor(index, screen)
+        except Exception as e:
+            log.error(f"Monitor capture failed: {e}", exc_info=True)
+            self._capture_failed(
+                "SwiftShot could not capture the selected monitor. Verify "
+                "the display connection and try again.")
+            return
+        self._finish_monitor_capture(index, screenshot)
+
+    def _finish_monitor_capture(self, index, screenshot):
+        try:
+            CaptureManager = _capture_manager()
             if screenshot:
                 log.info(f"Monitor {index} captured: "
-                         f"{screenshot.width()}x{screenshot.height()}")
+                         f"{screenshot.width()}x{screenshot.height()} "
+                         f"via {CaptureManager._last_screenshot_backend}")
                 self._handle_capture(screenshot)
             else:
                 log.warning(f"Monitor {index} capture returned None")
@@ -707,40 +989,14 @@ class SwiftShotApp:
         self._start_region_overlay("rectangle")
 
     def _start_region_overlay(self, mode="rectangle", ocr_mode=False):
-        try:
-            from capture import CaptureManager
-            from overlay import RegionSelector
+        self._grab_desktop(
+            lambda full: self._show_region_overlay(full, mode, ocr_mode),
+            "SwiftShot could not read the desktop. Verify that the "
+            "screens are connected and try again.")
 
-            full = CaptureManager.capture_fullscreen()
-            if full is None:
-                log.warning("capture_fullscreen returned None")
-                self._capture_failed(
-                    "SwiftShot could not read the desktop. Verify that the "
-                    "screens are connected and try again.")
-                return
-
-            self._overlay = RegionSelector(full, mode=mode)
-            overlay = self._overlay
-            generation = self._capture_generation
-            self._overlay._ocr_mode = ocr_mode
-            self._overlay._full_screenshot = full
-            self._overlay.region_selected.connect(
-                lambda rect, g=generation, o=overlay:
-                    self._on_region_selected(full, rect, ocr_mode, g, o)
-            )
-            self._overlay.freehand_selected.connect(
-                lambda data, g=generation, o=overlay:
-                    self._on_freehand_selected(full, data, g, o)
-            )
-            self._overlay.switch_to_window.connect(
-                lambda g=generation, o=overlay:
-                    self._switch_to_window_mode(full, g, o)
-            )
-            self._overlay.cancelled.connect(
-                lambda g=generation, o=overlay:
-                    self._cancel_region_overlay(g, o)
-            )
-            self._overlay.show_spanning()
+    def _show_region_overlay(self, full, mode="rectangle", ocr_mode=False):
+        try:
+            self._build_region_overlay(full, mode, ocr_mode).show_spanning()
         except Exception as e:
             log.error(f"Region overlay failed: {e}")
             self._capture_failed(
@@ -760,13 +1016,12 @@ class SwiftShotApp:
             return
 
         # Save last region
-        config.LAST_REGION = f"{rect.x()},{rect.y()},{rect.width()},{rect.height()}"
-        config.save()
+        self._remember_last_region(rect)
 
         if ocr_mode:
             # OCR doesn't use timer - crop from the already-taken screenshot
             try:
-                from capture import CaptureManager
+                CaptureManager = _capture_manager()
                 cropped = CaptureManager.crop_image(full_screenshot, rect)
                 if cropped:
                     self._do_ocr(cropped)
@@ -787,7 +1042,7 @@ class SwiftShotApp:
         else:
             # Immediate capture from the already-taken screenshot
             try:
-                from capture import CaptureManager
+                CaptureManager = _capture_manager()
                 cropped = CaptureManager.crop_image(full_screenshot, rect)
                 if cropped:
                     self._handle_capture(cropped)
@@ -820,14 +1075,13 @@ class SwiftShotApp:
         if rect.width() < 1 or rect.height() < 1:
             return
 
-        config.LAST_REGION = f"{rect.x()},{rect.y()},{rect.width()},{rect.height()}"
-        config.save()
+        self._remember_last_region(rect)
 
         if config.CAPTURE_TIMER_ENABLED and config.CAPTURE_TIMER_SECONDS > 0:
             self._timed_capture_region(rect, points, generation)
             return
         try:
-            from capture import CaptureManager
+            CaptureManager = _capture_manager()
             from utils import apply_freehand_mask
             cropped = CaptureManager.crop_image(full_screenshot, rect)
             if cropped:
@@ -843,6 +1097,44 @@ class SwiftShotApp:
                 "SwiftShot could not create the freehand capture. Draw the "
                 "region again.")
 
+    def _build_region_overlay(self, full, mode="rectangle", ocr_mode=False):
+        """Bind the region overlay to ``full`` for the current capture.
+
+        A previously closed RegionSelector is reset and rewired instead of
+        rebuilding a desktop-sized widget on every capture or Space toggle.
+        """
+        overlay = self._region_selector_pool
+        self._region_selector_pool = None
+        if overlay is not None:
+            overlay.reset(full, mode)
+        else:
+            RegionSelector = _region_selector()
+            overlay = RegionSelector(full, mode=mode)
+        self._overlay = overlay
+        generation = self._capture_generation
+        overlay._ocr_mode = ocr_mode
+        # The slots read the screenshot from the overlay rather than closing
+        # over it, so _close_overlay can drop the last reference.
+        overlay._full_screenshot = full
+        overlay.region_selected.connect(
+            lambda rect, g=generation, o=overlay:
+                self._on_region_selected(
+                    o._full_screenshot, rect, o._ocr_mode, g, o)
+        )
+        overlay.freehand_selected.connect(
+            lambda data, g=generation, o=overlay:
+                self._on_freehand_selected(o._full_screenshot, data, g, o)
+        )
+        overlay.switch_to_window.connect(
+            lambda g=generation, o=overlay:
+                self._switch_to_window_mode(o._full_screenshot, g, o)
+        )
+        overlay.cancelled.connect(
+            lambda g=generation, o=overlay:
+                self._cancel_region_overlay(g, o)
+        )
+        return overlay
+
     def _close_overlay(self, expected=None):
         if expected is not None and self._overlay is not expected:
             try:
@@ -851,12 +1143,21 @@ class SwiftShotApp:
                 pass
             return
         if self._overlay:
+            overlay = self._overlay
+            self._overlay = None
             try:
-                self._overlay.hide()
-                self._overlay.close()
+                overlay.hide()
+                overlay.close()
+                # close() only hides (no WA_DeleteOnClose); keep the widget
+                # for the next capture but drop its frozen desktop now.
+                _disconnect_all(overlay.region_selected,
+                                overlay.freehand_selected,
+                                overlay.switch_to_window, overlay.cancelled)
+                overlay._full_screenshot = None
+                overlay.release()
+                self._region_selector_pool = overlay
             except Exception:
                 pass
-            self._overlay = None
 
     def _cancel_region_overlay(self, generation, overlay):
         self._close_overlay(overlay)
@@ -880,24 +1181,14 @@ class SwiftShotApp:
         self._capture_with_delay(self._do_window_capture)
 
     def _do_window_capture(self):
-        try:
-            from capture import CaptureManager
-            full = CaptureManager.capture_fullscreen()
-            if full is None:
-                self._capture_failed(
-                    "SwiftShot could not read the desktop for window capture. "
-                    "Try again or use region capture.")
-                return
-            self._start_window_picker(full)
-        except Exception as e:
-            log.error(f"Window capture failed: {e}")
-            self._capture_failed(
-                "SwiftShot could not read the desktop for window capture. "
-                "Try again or use region capture.")
+        self._grab_desktop(
+            self._start_window_picker,
+            "SwiftShot could not read the desktop for window capture. "
+            "Try again or use region capture.")
 
     def _start_window_picker(self, full_screenshot):
         try:
-            from window_picker import WindowPicker
+            WindowPicker = _window_picker_class()
             self._close_window_picker()
             self._window_picker = WindowPicker(full_screenshot)
             picker = self._window_picker
@@ -905,11 +1196,11 @@ class SwiftShotApp:
             self._window_picker._full_screenshot = full_screenshot
             self._window_picker.element_selected.connect(
                 lambda rect, g=generation, p=picker:
-                    self._on_window_selected(full_screenshot, rect, g, p)
+                    self._on_window_selected(p._full_screenshot, rect, g, p)
             )
             self._window_picker.switch_to_region.connect(
                 lambda g=generation, p=picker:
-                    self._switch_to_region_mode(full_screenshot, g, p)
+                    self._switch_to_region_mode(p._full_screenshot, g, p)
             )
             self._window_picker.cancelled.connect(
                 lambda g=generation, p=picker:
@@ -939,7 +1230,7 @@ class SwiftShotApp:
             self._timed_capture_region(rect, generation=generation)
         else:
             try:
-                from capture import CaptureManager
+                CaptureManager = _capture_manager()
                 cropped = CaptureManager.crop_image(full_screenshot, rect)
                 if cropped:
                     self._handle_capture(cropped)
@@ -961,12 +1252,16 @@ class SwiftShotApp:
                 pass
             return
         if self._window_picker:
+            picker = self._window_picker
+            self._window_picker = None
             try:
-                self._window_picker.hide()
-                self._window_picker.close()
+                picker.hide()
+                picker.close()
+                _disconnect_all(picker.element_selected,
+                                picker.switch_to_region, picker.cancelled)
+                picker._full_screenshot = None
             except Exception:
                 pass
-            self._window_picker = None
 
     def _cancel_window_picker(self, generation, picker):
         self._close_window_picker(picker)
@@ -994,9 +1289,8 @@ class SwiftShotApp:
                  f"{rect.width()}x{rect.height()}")
 
         try:
-            from countdown_overlay import CountdownOverlay
             self._supersede_countdown()
-            overlay = CountdownOverlay(total_ms)
+            overlay = self._acquire_countdown(total_ms)
             overlay.countdown_finished.connect(
                 lambda r=QRect(rect), g=generation:
                     self._timed_capture_fire(r, freehand_points, g)
@@ -1004,7 +1298,7 @@ class SwiftShotApp:
             overlay.cancelled.connect(
                 lambda g=generation, o=overlay: self._cancel_capture(g, o)
             )
-            self._countdown = overlay  # prevent GC
+            self._countdown = overlay
             overlay.start()
         except Exception as e:
             log.error(f"Timed capture countdown failed: {e}")
@@ -1018,11 +1312,32 @@ class SwiftShotApp:
         if not self._capture_is_current(generation):
             return
         self._countdown = None
+        region = self._grab_known_region(rect)
+        if region is not None:
+            self._finish_timed_capture(None, rect, freehand_points, region)
+            return
+        self._grab_desktop(
+            lambda fresh, r=QRect(rect), p=freehand_points:
+                self._finish_timed_capture(fresh, r, p),
+            "SwiftShot could not refresh the screen after the countdown. "
+            "Try the timed capture again.")
+
+    def _grab_known_region(self, rect):
+        """Grab only ``rect`` when its position is already known, or None
+        to fall back to a full-desktop grab and crop."""
+        try:
+            return _capture_manager().capture_region(rect)
+        except Exception as e:
+            log.warning(f"Direct region grab failed: {e}")
+            return None
+
+    def _finish_timed_capture(self, fresh, rect, freehand_points=None,
+                              cropped=None):
         try:
-            from capture import CaptureManager
-            fresh = CaptureManager.capture_fullscreen()
-            if fresh:
-                cropped = CaptureManager.crop_image(fresh, rect)
+            CaptureManager = _capture_manager()
+            if cropped is not None or fresh:
+                if cropped is None:
+                    cropped = CaptureManager.crop_image(fresh, rect)
                 if cropped:
                     if freehand_points:
                         from utils import apply_freehand_mask
@@ -1057,8 +1372,10 @@ class SwiftShotApp:
         if not self._capture_is_current(generation):
             return
         self._close_overlay(overlay)
+        # Both modes reuse the frozen screenshot, so nothing has to repaint
+        # before the next overlay appears; just leave the signal handler.
         QTimer.singleShot(
-            50,
+            0,
             lambda g=generation: self._run_capture_callback(
                 g, lambda: self._start_window_picker(full_screenshot)
             ),
@@ -1072,26 +1389,9 @@ class SwiftShotApp:
             return
         self._close_window_picker(picker)
         try:
-            from overlay import RegionSelector
-            self._overlay = RegionSelector(full_screenshot, mode="rectangle")
-            overlay = self._overlay
-            self._overlay._full_screenshot = full_screenshot
-            self._overlay.region_selected.connect(
-                lambda rect, g=generation, o=overlay:
-                    self._on_region_selected(
-                        full_screenshot, rect, False, g, o
-                    )
-            )
-            self._overlay.switch_to_window.connect(
-                lambda g=generation, o=overlay:
-                    self._switch_to_window_mode(full_screenshot, g, o)
-            )
-            self._overlay.cancelled.connect(
-                lambda g=generation, o=overlay:
-                    self._cancel_region_overlay(g, o)
-            )
+            overlay = self._build_region_overlay(full_screenshot, "rectangle")
             QTimer.singleShot(
-                50,
+                0,
                 lambda g=generation, o=overlay:
                     self._run_capture_callback(g, o.show_spanning),
             )
@@ -1111,7 +1411,7 @@ class SwiftShotApp:
     def _do_fullscreen_capture(self):
         try:
             generation = self._capture_generation
-            screens = QApplication.screens()
+            screens = self._current_screens()
             if len(screens) > 1:
                 from monitor_picker import MonitorPicker
                 from PyQt5.QtWidgets import QDialog
@@ -1130,14 +1430,10 @@ class SwiftShotApp:
                 else:
                     self._cancel_capture(generation)
             else:
-                from capture import CaptureManager
-                screenshot = CaptureManager.capture_fullscreen()
-                if screenshot:
-                    self._handle_capture(screenshot)
-                else:
-                    self._capture_failed(
-                        "SwiftShot could not read the desktop. Verify that the "
-                        "screen is available and try again.")
+                self._grab_desktop(
+                    self._handle_capture,
+                    "SwiftShot could not read the desktop. Verify that the "
+                    "screen is available and try again.")
         except Exception as e:
             log.error(f"Fullscreen capture failed: {e}")
             self._capture_failed(
@@ -1154,18 +1450,50 @@ class SwiftShotApp:
             return
         self._capture_with_delay(self._do_last_region_capture)
 
-    def _do_last_region_capture(self):
+    def _remember_last_region(self, rect):
+        value = f"{rect.x()},{rect.y()},{rect.width()},{rect.height()}"
+        self._last_region = (value, QRect(rect))
+        config.LAST_REGION = value
+        config.save()
+
+    def _last_region_rect(self):
+        """Return config.LAST_REGION as a QRect, or None if it is malformed.
+
+        The parsed rect is cached against the stored string, so repeated
+        Shift+PrtSc presses skip the parse while an imported or reset
+        configuration is still picked up.
+        """
+        value = config.LAST_REGION
+        cached = self._last_region
+        if cached is not None and cached[0] == value:
+            return QRect(cached[1])
         try:
-            parts = config.LAST_REGION.split(',')
-            x, y, w, h = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+            parts = value.split(',')
+            rect = QRect(int(parts[0]), int(parts[1]),
+                         int(parts[2]), int(parts[3]))
         except (ValueError, IndexError):
+            return None
+        self._last_region = (value, rect)
+        return QRect(rect)
+
+    def _do_last_region_capture(self):
+        rect = self._last_region_rect()
+        if rect is None:
             self.capture_region()
             return
+        region = self._grab_known_region(rect)
+        if region is not None:
+            self._handle_capture(region)
+            return
+        self._grab_desktop(
+            lambda full, r=rect: self._finish_last_region(full, r),
+            "SwiftShot could not read the desktop. Select a new region "
+            "and try again.")
+
+    def _finish_last_region(self, full, rect):
         try:
-            from capture import CaptureManager
-            full = CaptureManager.capture_fullscreen()
+            CaptureManager = _capture_manager()
             if full:
-                rect = QRect(x, y, w, h)
                 cropped = CaptureManager.crop_image(full, rect)
                 if cropped:
                     self._handle_capture(cropped)
@@ -1376,37 +1704,70 @@ class SwiftShotApp:
         actions = config.get_after_capture_actions()
         log.info(f"Capture received: {pixmap.width()}x{pixmap.height()} "
                  f"actions={actions}")
-        # Save to history immediately with no OCR text; if auto-OCR is on, run
-        # it asynchronously and UPDATE the row when it finishes so the slow
-        # WinRT subprocess never blocks the capture.
+        # Save to history in the background with no OCR text; if auto-OCR is
+        # on, run it asynchronously and UPDATE the row when it finishes so
+        # neither the PNG encode nor the slow WinRT subprocess blocks the
+        # capture.
+        if config.CAPTURE_HISTORY_ENABLED:
+            self._save_history_async(pixmap)
+
+        for action in actions:
+            handler = _AFTER_CAPTURE_HANDLERS.get(action)
+            if handler:
+                getattr(self, handler)(pixmap)
+
+    def _save_history_async(self, pixmap):
         try:
-            from capture_history import save_to_history
-            saved_path = save_to_history(pixmap, "")
-            if saved_path and config.CAPTURE_HISTORY_AUTO_OCR:
-                self._start_history_ocr(saved_path)
-            elif config.CAPTURE_HISTORY_ENABLED and not saved_path:
-                self._notify(
-                    "Capture not added to history",
-                    "The capture is still available in its selected workflow "
-                    "destinations, but SwiftShot could not save the history "
-                    "copy. Verify the history folder and export diagnostics "
-                    "if the problem continues.",
-                    warning=True, required=True)
+            self._start_pool_task(
+                _HistorySaveTask(pixmap.toImage()),
+                self._on_history_saved, self._on_history_save_failed)
         except Exception as e:
-            log.warning(f"Could not save to history: {e}")
+            self._on_history_save_failed(str(e))
+
+    def _start_pool_task(self, task, on_done, on_failed):
+        """Run a _TaskSignals-backed QRunnable on the global thread pool.
+
+        The signal holder is kept until a result arrives; dropping it
+        earlier would disconnect the queued result on its way to the GUI
+        thread.
+        """
+        signals = task.signals
+        signals.done.connect(
+            lambda result, s=signals:
+                self._finish_pool_task(s, on_done, result))
+        signals.failed.connect(
+            lambda message, s=signals:
+                self._finish_pool_task(s, on_failed, message))
+        self._pool_tasks.append(signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_pool_task(self, signals, callback, payload):
+        if signals in self._pool_tasks:
+            self._pool_tasks.remove(signals)
+        callback(payload)
+
+    def _on_history_saved(self, saved_path):
+        dialog = self._history_dialog
+        if saved_path and dialog is not None and dialog.isVisible():
+            dialog._load_history()
+        if saved_path and config.CAPTURE_HISTORY_AUTO_OCR:
+            self._start_history_ocr(saved_path)
+        elif config.CAPTURE_HISTORY_ENABLED and not saved_path:
             self._notify(
                 "Capture not added to history",
                 "The capture is still available in its selected workflow "
-                "destinations. Verify the history folder and try again.",
+                "destinations, but SwiftShot could not save the history "
+                "copy. Verify the history folder and export diagnostics "
+                "if the problem continues.",
                 warning=True, required=True)
 
-        for action in actions:
-            if action == "editor":
-                self._open_editor(pixmap)
-            elif action == "save":
-                self._save_directly(pixmap)
-            elif action == "clipboard":
-                self._copy_to_clipboard(pixmap)
+    def _on_history_save_failed(self, message):
+        log.warning(f"Could not save to history: {message}")
+        self._notify(
+            "Capture not added to history",
+            "The capture is still available in its selected workflow "
+            "destinations. Verify the history folder and try again.",
+            warning=True, required=True)
 
     def _apply_beautification(self, pixmap):
         if config.BEAUTIFY_PRESET == "none":
@@ -1476,7 +1837,7 @@ class SwiftShotApp:
             )
             return False
         try:
-            from editor import ImageEditor
+            ImageEditor = _image_editor()
             # Reuse an existing editor window if the user asked for it --
             # but only one without unsaved changes, never discarding work.
             if config.EDITOR_REUSE_EDITOR:
@@ -1530,7 +1891,10 @@ class SwiftShotApp:
                 height=pixmap.height(),
                 **get_foreground_window_metadata(),
             )
-            os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+            directory = os.path.dirname(filepath) or '.'
+            if directory not in self._known_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._known_dirs.add(directory)
             success = save_pixmap(
                 pixmap,
                 filepath,
@@ -1560,6 +1924,9 @@ class SwiftShotApp:
                         duration_ms=2000)
                 log.info(f"Screenshot saved: {filepath}")
             else:
+                # The folder may have been removed behind our back; check
+                # it again on the next save.
+                self._known_dirs.discard(directory)
                 log.error(f"Direct save failed: {filepath}")
                 self._notify(
                     "Screenshot not saved",
@@ -1635,10 +2002,23 @@ class SwiftShotApp:
                 "for details and try again.",
                 warning=True, required=True)
 
-    def _open_history_image(self, filepath):
+    def _load_history_image(self, filepath, on_loaded, on_failed):
+        """Decode a history PNG off the GUI thread, then hand the pixmap to
+        ``on_loaded``; a 4K decode otherwise stalls the history dialog."""
+        def loaded(image):
+            pixmap = QPixmap.fromImage(image)
+            if pixmap.isNull():
+                on_failed("the decoded image is empty")
+            else:
+                on_loaded(pixmap)
+
         try:
-            self._open_editor(_load_file_pixmap(filepath))
+            self._start_pool_task(_ImageLoadTask(filepath), loaded, on_failed)
         except Exception as error:
+            on_failed(str(error))
+
+    def _open_history_image(self, filepath):
+        def failed(error):
             log.warning(f"Could not open history image {filepath}: {error}")
             self._notify(
                 "Capture could not be opened",
@@ -1646,10 +2026,10 @@ class SwiftShotApp:
                 "capture history and try again.",
                 warning=True, required=True)
 
+        self._load_history_image(filepath, self._open_editor, failed)
+
     def _pin_history_image(self, filepath):
-        try:
-            self.pin_pixmap(_load_file_pixmap(filepath))
-        except Exception as error:
+        def failed(error):
             log.warning(f"Could not pin history image {filepath}: {error}")
             self._notify(
                 "Capture could not be pinned",
@@ -1657,6 +2037,8 @@ class SwiftShotApp:
                 "capture history and try again.",
                 warning=True, required=True)
 
+        self._load_history_image(filepath, self.pin_pixmap, failed)
+
     # -------------------------------------------------------------------
     # Clipboard Watcher
     # -------------------------------------------------------------------
@@ -1688,7 +2070,12 @@ class SwiftShotApp:
                 duration_ms=1500)
 
     def _start_clipboard_watcher(self):
-        """Watch the clipboard via Qt's change signal (no polling)."""
+        """Watch the clipboard via Qt's change signal (no polling).
+
+        On Windows Qt 5 already drives dataChanged from
+        AddClipboardFormatListener / WM_CLIPBOARDUPDATE, so nothing wakes
+        the app until the clipboard actually changes.
+        """
         if self._clipboard_watcher_connected:
             return
         QApplication.clipboard().dataChanged.connect(self._on_clipboard_changed)
@@ -1707,20 +2094,27 @@ class SwiftShotApp:
 
     def _on_clipboard_changed(self):
         try:
-            import time
             clipboard = QApplication.clipboard()
             # Ignore our own copies (capture actions, editor copy, OCR text)
             if clipboard.ownsClipboard():
                 return
-            mime = clipboard.mimeData()
-            if not mime or not mime.hasImage():
-                return
-            # Some apps fire several change notifications per copy
+            # Some apps fire several change notifications per copy. Drop the
+            # repeats before mimeData(), which opens the clipboard and asks
+            # the source application to render its formats.
             now = time.monotonic()
             if now - self._last_clipboard_change < 0.5:
                 return
+            mime = clipboard.mimeData()
+            if not mime or not mime.hasImage():
+                return
             self._last_clipboard_change = now
-            pixmap = clipboard.pixmap()
+            # Decode from the mime data already fetched; clipboard.pixmap()
+            # would fetch it again and convert through the same QImage.
+            image = mime.imageData()
+            if isinstance(image, QImage):
+                pixmap = QPixmap.fromImage(image)
+            else:
+                pixmap = image if isinstance(image, QPixmap) else None
             if pixmap and not pixmap.isNull():
                 self._open_editor(pixmap)
         except Exception as e:
@@ -1764,11 +2158,8 @@ class SwiftShotApp:
 
     def _reapply_theme(self):
         """Re-apply the current theme across the app, tray, and open editors."""
-        from theme import apply_theme, stylesheet_for_theme
+        from theme import apply_theme
         apply_theme(self.app, config.THEME)
-        if self.tray_icon and self.tray_icon.contextMenu():
-            self.tray_icon.contextMenu().setStyleSheet(
-                stylesheet_for_theme(config.THEME))
         for editor in list(self.editors):
             try:
                 if editor.isVisible() and hasattr(editor, "retheme"):
@@ -1888,15 +2279,29 @@ class SwiftShotApp:
             except Exception:
                 pass
         self._stop_clipboard_watcher()
-        # Join the update-check thread so it can't emit into a torn-down app
-        # ("QThread: Destroyed while thread is still running").
+        # Abort an in-flight update request so it can't emit into a
+        # torn-down app.
         if self._update_checker is not None:
             try:
-                self._update_checker.requestInterruption()
-                if not self._update_checker.wait(5000):
-                    log.warning("Update checker did not stop before shutdown")
+                self._update_checker.cancel()
             except Exception:
                 pass
+        # Same for an in-flight desktop grab; a blit finishes in well under
+        # a second, and its result is dropped by the capture generation bump.
+        for worker in list(getattr(self, "_capture_workers", ())):
+            try:
+                if not worker.wait(2000):
+                    log.warning("Desktop grab did not finish before shutdown")
+            except Exception:
+                pass
+        try:
+            _capture_manager().release_gdi_cache()
+        except Exception:
+            log.warning("Could not release the GDI capture surface",
+                        exc_info=True)
+        # Let queued history saves finish writing their PNG and index row.
+        if not QThreadPool.globalInstance().waitForDone(5000):
+            log.warning("History save did not finish before shutdown")
         # Close all pin windows
         for pin in list(self._pin_windows):
             try:
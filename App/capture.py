@@ -6,9 +6,11 @@ Includes mouse pointer overlay and camera sound support.
 """
 
 import sys
+import threading
+from PyQt5 import sip
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QCursor
-from PyQt5.QtCore import QPoint, QRect, Qt
+from PyQt5.QtCore import QPoint, QRect, Qt, QThread, pyqtSignal
 
 from utils import virtual_geometry
 from config import config
@@ -39,18 +41,78 @@ if sys.platform == 'win32':
 class CaptureManager:
     """Static methods for capturing screenshots."""
 
+    # Backend that produced the most recent desktop/monitor grab: "dxcam",
+    # "gdi" or "qt".
+    _last_screenshot_backend = None
+    # dxcam (DXGI Desktop Duplication) is an optional dependency. None means
+    # not probed yet, False means unavailable; cameras are cached per output
+    # (a failed create is cached as None so it is not retried per capture).
+    _dxcam_module = None
+    _dxcam_cameras = {}
+    # Last full frame per output. Desktop Duplication reports "no new frame"
+    # when nothing changed since the previous acquire, so that frame is
+    # still exact; a region grab consumes the change state and drops it.
+    _dxcam_frames = {}
+    # GDI fallback: memory DC with a desktop-sized DIB section selected,
+    # kept between grabs and rebuilt only when the virtual desktop resizes.
+    # Guarded by _gdi_lock because grabs run on CaptureWorker threads.
+    _gdi_cache = {"size": None, "hdc_mem": None, "hbmp": None,
+                  "old_bmp": None, "bits": None}
+    _gdi_lock = threading.RLock()
+    # HCURSOR -> (rendered QImage or None, hotspot); see _cursor_shape.
+    _cursor_cache = {}
+
     @staticmethod
     def capture_fullscreen():
         """Capture the entire virtual desktop (all monitors)."""
-        pixmap = None
+        image = None
+        if sys.platform == 'win32':
+            image = CaptureManager.grab_desktop_image(len(QApplication.screens()))
+        return CaptureManager.desktop_pixmap(image)
+
+    @staticmethod
+    def grab_desktop_image(screen_count):
+        """Grab the virtual desktop into a QImage with the native backends.
+
+        Only QImage is touched, so this is safe on a worker thread (QPixmap
+        is GUI-thread only). Returns None off Windows or when every native
+        backend failed; ``desktop_pixmap`` then falls back to Qt.
+        """
+        if sys.platform != 'win32':
+            return None
+        # Desktop Duplication copies the composited frame in ~10 ms where
+        # a 4K GDI BitBlt takes ~100 ms. One DXGI output only covers one
+        # monitor, so the spanning multi-monitor grab stays on GDI.
+        if screen_count == 1:
+            image = CaptureManager._grab_dxcam_image(0)
+            if image is not None:
+                CaptureManager._last_screenshot_backend = "dxcam"
+                return image
         try:
-            if sys.platform == 'win32':
-                pixmap = CaptureManager._capture_fullscreen_win32()
+            image = CaptureManager._capture_fullscreen_win32()
+            CaptureManager._last_screenshot_backend = "gdi"
+            return image
         except Exception as e:
-            log.warning(f"Win32 fullscreen capture failed, falling back to Qt: {e}")
+            log.warning(
+                f"Win32 fullscreen capture failed, falling back to Qt: {e}")
+        return None
+
+    @staticmethod
+    def desktop_pixmap(image):
+        """Finish a desktop grab on the GUI thread.
+
+        Converts the native ``image`` (falling back to Qt's per-screen grab
+        when it is None) and overlays the mouse pointer if enabled.
+        """
+        pixmap = None
+        if image is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            if pixmap.isNull():
+                pixmap = None
 
         if pixmap is None:
             pixmap = CaptureManager.capture_rect(virtual_geometry())
+            CaptureManager._last_screenshot_backend = "qt"
 
         if pixmap and config.CAPTURE_MOUSE_POINTER:
             pixmap = CaptureManager._draw_cursor(pixmap)
@@ -59,6 +121,125 @@ class CaptureManager:
         # not here: this method also grabs overlay backdrops.
         return pixmap
 
+    @staticmethod
+    def _dxcam_camera(output_idx):
+        """Return the cached dxcam camera for one DXGI output, or None."""
+        cameras = CaptureManager._dxcam_cameras
+        if output_idx in cameras:
+            return cameras[output_idx]
+        if CaptureManager._dxcam_module is None:
+            try:
+                import dxcam
+                CaptureManager._dxcam_module = dxcam
+            except Exception:
+                CaptureManager._dxcam_module = False
+        camera = None
+        if CaptureManager._dxcam_module:
+            try:
+                camera = CaptureManager._dxcam_module.create(
+                    output_idx=output_idx, output_color="BGRA")
+            except Exception as e:
+                log.info(f"dxcam unavailable for output {output_idx}; "
+                         f"using GDI capture: {e}")
+        cameras[output_idx] = camera
+        return camera
+
+    @staticmethod
+    def _grab_dxcam(output_idx=0):
+        """Grab one DXGI output as a QPixmap, or None to fall back."""
+        image = CaptureManager._grab_dxcam_image(output_idx)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        return None if pixmap.isNull() else pixmap
+
+    @staticmethod
+    def _grab_dxcam_image(output_idx=0, region=None):
+        """Grab one DXGI output as a QImage, or None to fall back.
+
+        ``region`` is an output-local ``(left, top, right, bottom)`` box;
+        only those pixels are copied out of the duplicated frame.
+        ``grab()`` returns None when the desktop has not changed since the
+        previous duplicated frame; the cached full frame is reused then, and
+        only without one does the GDI path supply the pixels.
+        """
+        camera = CaptureManager._dxcam_camera(output_idx)
+        if camera is None:
+            return None
+        try:
+            frame = (camera.grab(region=region) if region is not None
+                     else camera.grab())
+        except Exception as e:
+            log.warning(f"dxcam grab failed for output {output_idx}: {e}")
+            return None
+        if frame is None:
+            return CaptureManager._unchanged_dxcam_frame(output_idx, region)
+        height, width = frame.shape[:2]
+        if (width < 1 or height < 1 or width > MAX_IMAGE_DIMENSION
+                or height > MAX_IMAGE_DIMENSION
+                or width * height > MAX_IMAGE_PIXELS):
+            return None
+        # BGRA bytes are Format_RGB32 on little-endian; like the GDI path,
+        # ignore the undefined alpha byte of a desktop frame.
+        image = QImage(frame.data, width, height, frame.strides[0],
+                       QImage.Format_RGB32).copy()
+        if image.isNull():
+            return None
+        if region is None:
+            CaptureManager._dxcam_frames[output_idx] = image
+        else:
+            CaptureManager._dxcam_frames.pop(output_idx, None)
+        return image
+
+    @staticmethod
+    def _unchanged_dxcam_frame(output_idx, region=None):
+        """The cached frame of an unchanged output (or its ``region``), or
+        None when no full frame has been kept."""
+        last = CaptureManager._dxcam_frames.get(output_idx)
+        if last is None:
+            return None
+        if region is None:
+            return last
+        left, top, right, bottom = region
+        box = QRect(left, top, right - left, bottom - top)
+        if not last.rect().contains(box):
+            return None
+        return last.copy(box)
+
+    @staticmethod
+    def capture_region(rect):
+        """Grab only ``rect`` (virtual-desktop coordinates, as used by the
+        overlays and LAST_REGION) through Desktop Duplication.
+
+        A small region of a 4K frame is copied directly instead of grabbing
+        ~33 MB and cropping. Returns None whenever the fast path does not
+        apply (no dxcam, several monitors, a rect that leaves the screen, or
+        no new frame); callers then grab the desktop and crop as before.
+        """
+        if sys.platform != 'win32' or rect is None:
+            return None
+        screens = QApplication.screens()
+        if len(screens) != 1:
+            return None
+        target = QRect(rect).translated(virtual_geometry().topLeft())
+        screen_geo = screens[0].geometry()
+        if (target.width() < 1 or target.height() < 1
+                or not screen_geo.contains(target)):
+            return None
+        local = target.translated(-screen_geo.topLeft())
+        image = CaptureManager._grab_dxcam_image(
+            0, (local.left(), local.top(),
+                local.right() + 1, local.bottom() + 1))
+        if image is None or image.size() != target.size():
+            return None
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            return None
+        CaptureManager._last_screenshot_backend = "dxcam"
+        if config.CAPTURE_MOUSE_POINTER:
+            pixmap = CaptureManager._draw_cursor(pixmap, target.topLeft())
+        return pixmap
+
     @staticmethod
     def capture_rect(rect):
         """Capture a global desktop rectangle through each intersecting screen.
@@ -115,8 +296,14 @@ class CaptureManager:
         return result if drew_pixels else None
 
     @staticmethod
-    def _draw_cursor(pixmap):
-        """Draw the mouse cursor onto the screenshot."""
+    def _draw_cursor(pixmap, origin=None):
+        """Draw the mouse cursor onto the screenshot, in place.
+
+        ``origin`` is the global position of the pixmap's top-left pixel;
+        it defaults to the virtual desktop origin (a full-desktop grab).
+        Callers pass the pixmap they just grabbed; if it were shared, Qt's
+        copy-on-write would detach it before the painter touches pixels.
+        """
         if sys.platform != 'win32':
             return pixmap
 
@@ -125,7 +312,6 @@ class CaptureManager:
             from ctypes import wintypes
 
             user32 = ctypes.windll.user32
-            gdi32 = ctypes.windll.gdi32
 
             class CURSORINFO(ctypes.Structure):
                 _fields_ = [
@@ -137,8 +323,6 @@ class CaptureManager:
 
             user32.GetCursorInfo.argtypes = [ctypes.POINTER(CURSORINFO)]
             user32.GetCursorInfo.restype = wintypes.BOOL
-            gdi32.DeleteObject.argtypes = [wintypes.HANDLE]
-            gdi32.DeleteObject.restype = wintypes.BOOL
 
             ci = CURSORINFO()
             ci.cbSize = ctypes.sizeof(CURSORINFO)
@@ -149,42 +333,16 @@ class CaptureManager:
             if not (ci.flags & CURSOR_SHOWING):
                 return pixmap
 
-            # Get virtual screen offset
-            geo = virtual_geometry()
+            # Offset of the captured area on the virtual desktop
+            geo = origin if origin is not None else virtual_geometry().topLeft()
+
+            cursor_img, (hot_x, hot_y) = CaptureManager._cursor_shape(ci.hCursor)
+            cursor_x = ci.ptScreenPos.x - geo.x() - hot_x
+            cursor_y = ci.ptScreenPos.y - geo.y() - hot_y
 
             # Draw cursor icon onto pixmap
-            result = pixmap.copy()
+            result = pixmap
             painter = QPainter(result)
-            cursor_x = ci.ptScreenPos.x - geo.x()
-            cursor_y = ci.ptScreenPos.y - geo.y()
-
-            # Get cursor hotspot and draw
-            class ICONINFO(ctypes.Structure):
-                _fields_ = [
-                    ('fIcon', wintypes.BOOL),
-                    ('xHotspot', wintypes.DWORD),
-                    ('yHotspot', wintypes.DWORD),
-                    ('hbmMask', wintypes.HBITMAP),
-                    ('hbmColor', wintypes.HBITMAP),
-                ]
-
-            user32.GetIconInfo.argtypes = [
-                wintypes.HANDLE, ctypes.POINTER(ICONINFO)]
-            user32.GetIconInfo.restype = wintypes.BOOL
-
-            ii = ICONINFO()
-            if user32.GetIconInfo(ci.hCursor, ctypes.byref(ii)):
-                cursor_x -= ii.xHotspot
-                cursor_y -= ii.yHotspot
-                if ii.hbmMask:
-                    gdi32.DeleteObject(ii.hbmMask)
-                if ii.hbmColor:
-                    gdi32.DeleteObject(ii.hbmColor)
-
-            # Render the ACTUAL cursor shape (I-beam / hand / resize / arrow)
-            # via DrawIconEx, not the app's QCursor (which is usually null and
-            # forced the generic arrow fallback).
-            cursor_img = CaptureManager._cursor_to_qimage(ci.hCursor)
             if cursor_img is not None and not cursor_img.isNull():
                 painter.drawImage(cursor_x, cursor_y, cursor_img)
             else:
@@ -213,6 +371,57 @@ class CaptureManager:
         except Exception:
             return pixmap
 
+    @staticmethod
+    def _cursor_shape(hcursor):
+        """Return ``(image, (hotspot_x, hotspot_y))`` for a Win32 HCURSOR.
+
+        System cursor handles are shared and stable, so the GetIconInfo
+        bitmaps and the two DrawIconEx renders happen once per shape rather
+        than on every capture.
+        """
+        cache = CaptureManager._cursor_cache
+        shape = cache.get(hcursor)
+        if shape is not None:
+            return shape
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        gdi32 = ctypes.windll.gdi32
+        gdi32.DeleteObject.argtypes = [wintypes.HANDLE]
+        gdi32.DeleteObject.restype = wintypes.BOOL
+
+        class ICONINFO(ctypes.Structure):
+            _fields_ = [
+                ('fIcon', wintypes.BOOL),
+                ('xHotspot', wintypes.DWORD),
+                ('yHotspot', wintypes.DWORD),
+                ('hbmMask', wintypes.HBITMAP),
+                ('hbmColor', wintypes.HBITMAP),
+            ]
+
+        user32.GetIconInfo.argtypes = [
+            wintypes.HANDLE, ctypes.POINTER(ICONINFO)]
+        user32.GetIconInfo.restype = wintypes.BOOL
+
+        hotspot = (0, 0)
+        ii = ICONINFO()
+        if user32.GetIconInfo(hcursor, ctypes.byref(ii)):
+            hotspot = (ii.xHotspot, ii.yHotspot)
+            if ii.hbmMask:
+                gdi32.DeleteObject(ii.hbmMask)
+            if ii.hbmColor:
+                gdi32.DeleteObject(ii.hbmColor)
+
+        # Render the ACTUAL cursor shape (I-beam / hand / resize / arrow)
+        # via DrawIconEx, not the app's QCursor (which is usually null and
+        # forced the generic arrow fallback).
+        shape = (CaptureManager._cursor_to_qimage(hcursor), hotspot)
+        if len(cache) >= 32:     # app-defined cursors come and go
+            cache.clear()
+        cache[hcursor] = shape
+        return shape
+
     @staticmethod
     def _cursor_to_qimage(hcursor):
         """Rasterize a Win32 HCURSOR to an ARGB32 QImage via DrawIconEx.
@@ -331,7 +540,8 @@ class CaptureManager:
 
     @staticmethod
     def _capture_fullscreen_win32():
-        """Capture fullscreen using Win32 API for better DPI handling."""
+        """Capture fullscreen to a QImage using Win32 API for better DPI
+        handling."""
         import ctypes
         from ctypes import wintypes
 
@@ -345,9 +555,12 @@ class CaptureManager:
         user32.ReleaseDC.restype = ctypes.c_int
         gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
         gdi32.CreateCompatibleDC.restype = wintypes.HDC
-        gdi32.CreateCompatibleBitmap.argtypes = [
-            wintypes.HDC, ctypes.c_int, ctypes.c_int]
-        gdi32.CreateCompatibleBitmap.restype = wintypes.HBITMAP
+        gdi32.CreateDIBSection.argtypes = [
+            wintypes.HDC, ctypes.POINTER(BITMAPINFOHEADER), wintypes.UINT,
+            ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE,
+            wintypes.DWORD,
+        ]
+        gdi32.CreateDIBSection.restype = wintypes.HBITMAP
         gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HANDLE]
         gdi32.SelectObject.restype = wintypes.HANDLE
         gdi32.BitBlt.argtypes = [
@@ -356,11 +569,8 @@ class CaptureManager:
             wintypes.DWORD,
         ]
         gdi32.BitBlt.restype = wintypes.BOOL
-        gdi32.GetDIBits.argtypes = [
-            wintypes.HDC, wintypes.HBITMAP, wintypes.UINT, wintypes.UINT,
-            ctypes.c_void_p, ctypes.POINTER(BITMAPINFOHEADER), wintypes.UINT,
-        ]
-        gdi32.GetDIBits.restype = ctypes.c_int
+        gdi32.GdiFlush.argtypes = []
+        gdi32.GdiFlush.restype = wintypes.BOOL
         gdi32.DeleteObject.argtypes = [wintypes.HANDLE]
         gdi32.DeleteObject.restype = wintypes.BOOL
         gdi32.DeleteDC.argtypes = [wintypes.HDC]
@@ -380,69 +590,99 @@ class CaptureManager:
                 or h > MAX_IMAGE_DIMENSION or w * h > MAX_IMAGE_PIXELS):
             raise ValueError(f"Virtual desktop size is unsafe: {w}x{h}")
 
-        hdc_screen = user32.GetDC(None)
-        if not hdc_screen:
-            raise OSError("GetDC failed")
+        with CaptureManager._gdi_lock:
+            hdc_screen = user32.GetDC(None)
+            if not hdc_screen:
+                raise OSError("GetDC failed")
+            try:
+                hdc_mem, bits = CaptureManager._gdi_surface(
+                    gdi32, hdc_screen, w, h)
+
+                # CAPTUREBLT includes layered/transparent windows (tooltips, some
+                # overlays) that plain SRCCOPY misses; without it they capture black.
+                SRCCOPY = 0x00CC0020
+                CAPTUREBLT = 0x40000000
+                if not gdi32.BitBlt(
+                        hdc_mem, 0, 0, w, h, hdc_screen, x, y,
+                        SRCCOPY | CAPTUREBLT):
+                    raise OSError("BitBlt failed")
+
+                gdi32.GdiFlush()   # BitBlt may be batched; finish before reading
+
+                # Screen blits carry undefined alpha bytes (layered windows can
+                # leave alpha < 255); RGB32 ignores them instead of saving
+                # transparent holes. copy() detaches from the cached DIB, which
+                # the next grab overwrites.
+                img = QImage(
+                    sip.voidptr(bits), w, h, w * 4, QImage.Format_RGB32).copy()
+                if img.isNull():
+                    raise OSError("Qt could not create the captured image")
+                return img
+            finally:
+                user32.ReleaseDC(None, hdc_screen)
+
+    @staticmethod
+    def _gdi_surface(gdi32, hdc_screen, w, h):
+        """Return (memory DC, pixel pointer) for a w x h top-down 32bpp DIB
+        section, reusing the cached one when the size is unchanged.
+
+        BitBlt lands directly in the section's memory, so no GetDIBits
+        copy-out is needed. Caller holds _gdi_lock.
+        """
+        import ctypes
+
+        cache = CaptureManager._gdi_cache
+        if cache["size"] == (w, h):
+            return cache["hdc_mem"], cache["bits"]
+        CaptureManager.release_gdi_cache()
+
         hdc_mem = None
         hbmp = None
-        old_bmp = None
-        bitmap_selected = False
         try:
             hdc_mem = gdi32.CreateCompatibleDC(hdc_screen)
             if not hdc_mem:
                 raise OSError("CreateCompatibleDC failed")
-            hbmp = gdi32.CreateCompatibleBitmap(hdc_screen, w, h)
-            if not hbmp:
-                raise OSError("CreateCompatibleBitmap failed")
-            old_bmp = gdi32.SelectObject(hdc_mem, hbmp)
-            if not old_bmp or old_bmp == ctypes.c_void_p(-1).value:
-                raise OSError("SelectObject failed")
-            bitmap_selected = True
-
-            # CAPTUREBLT includes layered/transparent windows (tooltips, some
-            # overlays) that plain SRCCOPY misses; without it they capture black.
-            SRCCOPY = 0x00CC0020
-            CAPTUREBLT = 0x40000000
-            if not gdi32.BitBlt(
-                    hdc_mem, 0, 0, w, h, hdc_screen, x, y,
-                    SRCCOPY | CAPTUREBLT):
-                raise OSError("BitBlt failed")
-
             bmi = BITMAPINFOHEADER()
             bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
             bmi.biWidth = w
             bmi.biHeight = -h
             bmi.biPlanes = 1
             bmi.biBitCount = 32
-            bmi.biCompression = 0
-
-            buf_size = w * h * 4
-            buf = ctypes.create_string_buffer(buf_size)
-            # GetDIBits requires the bitmap NOT to be selected into a DC.
-            if not gdi32.SelectObject(hdc_mem, old_bmp):
-                raise OSError("Could not deselect capture bitmap")
-            bitmap_selected = False
-            scan_lines = gdi32.GetDIBits(
-                hdc_mem, hbmp, 0, h, buf, ctypes.byref(bmi), 0)
-            if scan_lines != h:
-                raise OSError(
-                    f"GetDIBits returned {scan_lines} of {h} scan lines")
-
-            # Screen blits carry undefined alpha bytes (layered windows can leave
-            # alpha < 255); RGB32 ignores them instead of saving transparent holes.
-            img = QImage(buf, w, h, w * 4, QImage.Format_RGB32)
-            pixmap = QPixmap.fromImage(img.copy())
-            if pixmap.isNull():
-                raise OSError("Qt could not create the captured image")
-            return pixmap
-        finally:
-            if bitmap_selected and hdc_mem and old_bmp:
-                gdi32.SelectObject(hdc_mem, old_bmp)
+            bmi.biCompression = 0       # BI_RGB
+            bits = ctypes.c_void_p()
+            hbmp = gdi32.CreateDIBSection(
+                hdc_screen, ctypes.byref(bmi), 0, ctypes.byref(bits), None, 0)
+            if not hbmp or not bits.value:
+                raise OSError("CreateDIBSection failed")
+            old_bmp = gdi32.SelectObject(hdc_mem, hbmp)
+            if not old_bmp or old_bmp == ctypes.c_void_p(-1).value:
+                raise OSError("SelectObject failed")
+        except Exception:
             if hbmp:
                 gdi32.DeleteObject(hbmp)
             if hdc_mem:
                 gdi32.DeleteDC(hdc_mem)
-            user32.ReleaseDC(None, hdc_screen)
+            raise
+        cache.update(size=(w, h), hdc_mem=hdc_mem, hbmp=hbmp,
+                     old_bmp=old_bmp, bits=bits.value)
+        return hdc_mem, bits.value
+
+    @staticmethod
+    def release_gdi_cache():
+        """Free the cached GDI capture surface (desktop-sized; call on exit)."""
+        with CaptureManager._gdi_lock:
+            cache = CaptureManager._gdi_cache
+            if cache["size"] is None:
+                return
+            import ctypes
+            gdi32 = ctypes.windll.gdi32
+            try:
+                gdi32.SelectObject(cache["hdc_mem"], cache["old_bmp"])
+                gdi32.DeleteObject(cache["hbmp"])
+                gdi32.DeleteDC(cache["hdc_mem"])
+            finally:
+                cache.update(size=None, hdc_mem=None, hbmp=None,
+                             old_bmp=None, bits=None)
 
     @staticmethod
     def capture_active_window():
@@ -498,16 +738,29 @@ class CaptureManager:
         return CaptureManager.capture_rect(QRect(x, y, w, h))
 
     @staticmethod
-    def capture_monitor(monitor_index=0):
+    def capture_monitor(monitor_index=0, screen=None):
         """Capture a specific monitor.
 
         Grabs via the monitor's own QScreen: grabbing another screen's
         area through the primary screen with logical coordinates returns
-        the wrong region under mixed/high-DPI scaling.
+        the wrong region under mixed/high-DPI scaling. Callers that keep a
+        screen list can pass the already-resolved ``screen``.
         """
-        screens = QApplication.screens()
-        if 0 <= monitor_index < len(screens):
-            return screens[monitor_index].grabWindow(0)
+        if screen is None:
+            screens = QApplication.screens()
+            if 0 <= monitor_index < len(screens):
+                screen = screens[monitor_index]
+        if screen is not None:
+            if sys.platform == 'win32':
+                # DXGI output order normally matches Qt's screen order; a
+                # frame of the wrong size means it does not, so use Qt.
+                pixmap = CaptureManager._grab_dxcam(monitor_index)
+                if (pixmap is not None
+                        and pixmap.size() == screen.geometry().size()):
+                    CaptureManager._last_screenshot_backend = "dxcam"
+                    return pixmap
+            CaptureManager._last_screenshot_backend = "qt"
+            return screen.grabWindow(0)
         return CaptureManager.capture_fullscreen()
 
     @staticmethod
@@ -519,6 +772,10 @@ class CaptureManager:
         crop_rect = rect.intersected(img_rect)
         if crop_rect.width() < 1 or crop_rect.height() < 1:
             return None
+        if crop_rect == img_rect:
+            # Whole-desktop selections share the pixels (copy-on-write)
+            # instead of blitting a second full-size buffer.
+            return QPixmap(pixmap)
         return pixmap.copy(crop_rect)
 
     @staticmethod
@@ -569,3 +826,25 @@ class CaptureManager:
                 pass
 
         return windows
+
+
+class CaptureWorker(QThread):
+    """Grab the desktop off the GUI thread so the event loop keeps pumping
+    (tray, clipboard, overlay teardown) during a 50-100 ms GDI blit. Only the
+    QImage grab runs here; ``image_ready`` delivers it to the GUI thread,
+    which finishes it with ``CaptureManager.desktop_pixmap``. A null image
+    means the native backends failed and the Qt fallback should run."""
+
+    image_ready = pyqtSignal(QImage)
+
+    def __init__(self, screen_count, parent=None):
+        super().__init__(parent)
+        self._screen_count = screen_count
+
+    def run(self):
+        image = None
+        try:
+            image = CaptureManager.grab_desktop_image(self._screen_count)
+        except Exception as e:
+            log.warning(f"Background desktop grab failed: {e}")
+        self.image_ready.emit(image if image is not None else QImage())
@@ -4,7 +4,7 @@ Panel showing thumbnails of recent captures with quick actions.
 """
 
 import os
-import glob
+import fnmatch
 import hashlib
 import json
 import re
@@ -20,7 +20,7 @@ from PyQt5.QtWidgets import (
     QScrollArea, QWidget, QApplication, QGridLayout, QFrame,
     QMenu, QMessageBox, QLineEdit, QCheckBox, QInputDialog
 )
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont, QPen
+from PyQt5.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QFont, QPen
 from PyQt5.QtCore import (
     Qt, pyqtSignal, QByteArray, QBuffer, QIODevice, QTimer
 )
@@ -32,6 +32,10 @@ from theme import colors_for_theme
 from utils import atomic_write_bytes, pil_to_qpixmap
 
 
+THUMBNAIL_SIZE = (164, 96)     # stored thumbnail_blob bounds
+# Qt maps PNG "quality" 80 to zlib level 1: several times faster than the
+# default level for desktop captures, for a modestly larger history file.
+HISTORY_PNG_QUALITY = 80
 IMAGE_EXTENSIONS = [
     '*.png', '*.jpg', '*.jpeg', '*.bmp',
     '*.gif', '*.tiff', '*.tif', '*.webp',
@@ -42,6 +46,9 @@ HISTORY_HEALTH_SCHEMA_VERSION = 1
 HASH_CHUNK_BYTES = 1024 * 1024
 _health_results = {}
 _health_lock = threading.Lock()
+# history_dir -> (directory st_mtime_ns, ((path, mtime), ...)). Adding,
+# removing or renaming a capture bumps the directory mtime.
+_history_scans = {}
 
 
 class _HistoryDatabaseCorrupt(RuntimeError):
@@ -52,12 +59,57 @@ class _HistoryCheckTimeout(RuntimeError):
     pass
 
 
+def _scan_history_dir(history_dir):
+    """Return ``((path, mtime), ...)`` for the history images in one
+    scandir pass, reusing the previous result while the directory's own
+    mtime is unchanged (Refresh and re-index skip the listing entirely)."""
+    try:
+        stamp = os.stat(history_dir).st_mtime_ns
+    except OSError:
+        return ()
+    cached = _history_scans.get(history_dir)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    found = []
+    try:
+        with os.scandir(history_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # glob semantics: hidden names are skipped, case follows the OS.
+                if name.startswith(".") or not any(
+                        fnmatch.fnmatch(name, ext) for ext in IMAGE_EXTENSIONS):
+                    continue
+                try:
+                    if entry.is_file():
+                        found.append((entry.path, entry.stat().st_mtime))
+                except OSError:
+                    continue
+    except OSError:
+        return ()
+    scan = tuple(found)
+    _history_scans[history_dir] = (stamp, scan)
+    return scan
+
+
 def _history_files(history_dir):
-    files = []
-    if os.path.isdir(history_dir):
-        for ext in IMAGE_EXTENSIONS:
-            files.extend(glob.glob(os.path.join(history_dir, ext)))
-    return files
+    return [path for path, _mtime in _scan_history_dir(history_dir)]
+
+
+def _history_path_exists(history_dir, scan=None):
+    """Return an ``exists(path)`` check answered from the folder scan, so
+    rows in the history folder are not stat()ed again one by one."""
+    if scan is None:
+        scan = _scan_history_dir(history_dir)
+    folder = os.path.normcase(os.path.normpath(history_dir))
+    present = {os.path.normcase(path) for path, _mtime in scan}
+
+    def exists(path):
+        # Only rows pointing outside the scanned folder need a real stat.
+        if os.path.normcase(os.path.dirname(path)) == folder:
+            return os.path.normcase(path) in present
+        return os.path.exists(path)
+
+    return exists
 
 
 HISTORY_SCHEMA_VERSION = 2   # 1 = base, 2 = + favorite/tags (R-31)
@@ -339,11 +391,11 @@ def _db(history_dir):
         conn.close()
 
 
-def _pixmap_png_bytes(pixmap):
+def _pixmap_png_bytes(pixmap, quality=-1):
     data = QByteArray()
     buffer = QBuffer(data)
     buffer.open(QIODevice.WriteOnly)
-    saved = pixmap.save(buffer, "PNG")
+    saved = pixmap.save(buffer, "PNG", quality)
     buffer.close()
     payload = bytes(data)
     if not saved or not payload:
@@ -363,8 +415,25 @@ def _safe_pixmap(path):
         return QPixmap()
 
 
+def _safe_thumbnail(path):
+    """Decode ``path`` and return ``(thumbnail, (width, height))``.
+
+    Only the downscaled image is converted to a QPixmap; a full-resolution
+    capture never becomes a desktop-sized pixmap just to draw a card.
+    Returns ``(QPixmap(), None)`` for a rejected file.
+    """
+    try:
+        image = load_image(path)
+        size = image.size
+        image.thumbnail(THUMBNAIL_SIZE)
+        return pil_to_qpixmap(image), size
+    except Exception as error:
+        log.warning(f"Rejected history image {path}: {error}")
+        return QPixmap(), None
+
+
 def _thumbnail_blob(pixmap):
-    thumb = pixmap.scaled(164, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    thumb = pixmap.scaled(*THUMBNAIL_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
     return _pixmap_png_bytes(thumb)
 
 
@@ -381,8 +450,8 @@ def _sha256_file(filepath):
 
 
 def _index_file(conn, filepath, mtime):
-    pixmap = _safe_pixmap(filepath)
-    if pixmap.isNull():
+    thumbnail, size = _safe_thumbnail(filepath)
+    if size is None:
         conn.execute(
             "INSERT OR REPLACE INTO seen_files (path, mtime) VALUES (?, ?)",
             (filepath, mtime))
@@ -398,11 +467,11 @@ def _index_file(conn, filepath, mtime):
         (
             filepath,
             created_at,
-            pixmap.width(),
-            pixmap.height(),
+            size[0],
+            size[1],
             digest,
             "",
-            _thumbnail_blob(pixmap),
+            _pixmap_png_bytes(thumbnail),
         ),
     )
     # Record the path either way — a content-duplicate that INSERT OR IGNORE
@@ -420,24 +489,22 @@ def _ensure_history_index(conn, history_dir):
     # with the mtime we saw — so we only re-index a file that actually changed.
     seen = {row["path"]: row["mtime"]
             for row in conn.execute("SELECT path, mtime FROM seen_files")}
+    scan = _scan_history_dir(history_dir)
+    exists = _history_path_exists(history_dir, scan)
     # Purge rows whose file was deleted outside the app. Otherwise they keep
     # occupying LIMIT slots (the panel filtered missing files AFTER the query,
     # so dead rows could starve the panel down to zero visible captures).
     for path in indexed:
-        if not os.path.exists(path):
+        if not exists(path):
             conn.execute("DELETE FROM captures WHERE path = ?", (path,))
     # Prune seen_files rows whose file is gone so the table can't grow forever.
     for path in list(seen):
-        if not os.path.exists(path):
+        if not exists(path):
             conn.execute("DELETE FROM seen_files WHERE path = ?", (path,))
             del seen[path]
-    for filepath in _history_files(history_dir):
+    for filepath, mtime in scan:
         if filepath in indexed:
             continue
-        try:
-            mtime = os.path.getmtime(filepath)
-        except OSError:
-            continue
         if seen.get(filepath) == mtime:
             continue                       # unchanged duplicate — skip re-hash
         try:
@@ -489,9 +556,10 @@ def _history_entries(history_dir, search_text="", favorites_only=False,
             """,
             (*params, config.CAPTURE_HISTORY_MAX),
         ).fetchall()
+    exists = _history_path_exists(history_dir)
     out = []
     for row in rows:
-        if not os.path.exists(row["path"]):
+        if not exists(row["path"]):
             continue
         d = dict(row)
         d["tags"] = _tags_from_str(d.get("tags", ""))
@@ -599,9 +667,17 @@ class HistoryThumbnail(QFrame):
         self._hovered = False
         self._pixmap = QPixmap()
         if isinstance(entry, dict) and entry.get("thumbnail_blob"):
-            self._pixmap.loadFromData(entry["thumbnail_blob"])
+            # Reopening or refreshing the dialog rebuilds every card; reuse
+            # the decoded thumbnail by content hash instead of re-inflating.
+            cache_key = f"swiftshot-history-thumb:{entry.get('sha256') or self.filepath}"
+            cached = QPixmapCache.find(cache_key)
+            if cached is not None and not cached.isNull():
+                self._pixmap = cached
+            elif self._pixmap.loadFromData(entry["thumbnail_blob"]):
+                QPixmapCache.insert(cache_key, self._pixmap)
         if self._pixmap.isNull():
-            self._pixmap = _safe_pixmap(self.filepath)
+            self._pixmap, _size = _safe_thumbnail(self.filepath)
+        self._scaled = None     # self._pixmap fitted to the card, per size
         self._filename = os.path.basename(self.filepath)
 
         # Parse timestamp from filename or file mod time
@@ -654,10 +730,14 @@ class HistoryThumbnail(QFrame):
             margin = 8
             thumb_area_w = w - margin * 2
             thumb_area_h = h - 40
-            scaled = self._pixmap.scaled(
-                thumb_area_w, thumb_area_h,
-                Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
+            # Hover and focus repaint the card often; rescale only when
+            # the thumbnail area itself changes.
+            if self._scaled is None or self._scaled[0] != (thumb_area_w, thumb_area_h):
+                self._scaled = ((thumb_area_w, thumb_area_h), self._pixmap.scaled(
+                    thumb_area_w, thumb_area_h,
+                    Qt.KeepAspectRatio, Qt.SmoothTransformation
+                ))
+            scaled = self._scaled[1]
             tx = margin + (thumb_area_w - scaled.width()) // 2
             ty = margin + (thumb_area_h - scaled.height()) // 2
             painter.drawPixmap(tx, ty, scaled)
@@ -1044,14 +1124,15 @@ class CaptureHistoryDialog(QDialog):
 
 
 def save_to_history(pixmap, ocr_text=""):
-    """Save a QPixmap to the capture history directory."""
+    """Save a QPixmap (or a QImage, off the GUI thread) to the capture
+    history directory."""
     if not config.CAPTURE_HISTORY_ENABLED:
         return None
     try:
         history_dir = config.CAPTURE_HISTORY_DIR
         os.makedirs(history_dir, exist_ok=True)
 
-        png_bytes = _pixmap_png_bytes(pixmap)
+        png_bytes = _pixmap_png_bytes(pixmap, HISTORY_PNG_QUALITY)
         digest = hashlib.sha256(png_bytes).hexdigest()
         with _db(history_dir) as conn:
             existing = conn.execute(
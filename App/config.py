@@ -295,9 +295,15 @@ class Config:
             value = list(value)
         setattr(self, key, value)
 
+    def _normalize_output_format(self):
+        # Stored lowercase so get_filename/save_pixmap never re-case it.
+        fmt = str(self.OUTPUT_FILE_FORMAT).lower()
+        if fmt not in OUTPUT_FILE_FORMAT_CHOICES:
+            fmt = Config.OUTPUT_FILE_FORMAT
+        self.OUTPUT_FILE_FORMAT = fmt
+
     def _normalize_enums(self):
-        if self.OUTPUT_FILE_FORMAT not in OUTPUT_FILE_FORMAT_CHOICES:
-            self.OUTPUT_FILE_FORMAT = Config.OUTPUT_FILE_FORMAT
+        self._normalize_output_format()
         if self.THEME not in ("dark", "light", "system"):
             self.THEME = Config.THEME
         if self.BEAUTIFY_PRESET not in BEAUTIFICATION_PRESETS:
@@ -415,6 +421,7 @@ class Config:
             self._log_warning(f"Could not load config: {e}")
 
     def save(self):
+        self._normalize_output_format()
         data = dict(self._unknown_keys)   # preserve newer-build keys first
         data.update({k: getattr(self, k) for k in self._get_saveable_keys()})
         try:
@@ -628,7 +635,7 @@ class Config:
     ):
         pattern = self.OUTPUT_FILENAME_PATTERN
 
-        ext = self.OUTPUT_FILE_FORMAT.lower()
+        ext = self.OUTPUT_FILE_FORMAT
         output_dir = self.get_output_directory()
         uses_counter = "{counter}" in pattern
         counter = 1
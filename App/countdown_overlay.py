@@ -32,6 +32,7 @@ class CountdownOverlay(QWidget):
         self._seconds_left = (self._total_ms + 999) // 1000
         self._generation = 0
         self._active_generation = None
+        self._started_at = 0.0
 
         self.setWindowFlags(
             Qt.WindowStaysOnTopHint |
@@ -109,6 +110,20 @@ class CountdownOverlay(QWidget):
         self.move(geo.right() - self.width() - 24,
                   geo.bottom() - self.height() - 24)
 
+    def reset(self, total_ms):
+        """Re-arm a finished or cancelled badge for a new countdown so the
+        controller can reuse one window instead of building another."""
+        self._generation += 1
+        self._active_generation = None
+        self._timer.stop()
+        self.hide()
+        self._total_ms = max(100, total_ms)
+        self._remaining_ms = self._total_ms
+        self._seconds_left = (self._total_ms + 999) // 1000
+        self.setAccessibleDescription(
+            f"Timed capture in {self._seconds_left} seconds. Activate Cancel "
+            "timed capture to stop it.")
+
     def start(self):
         """Show the badge and start counting down."""
         self._position_badge()
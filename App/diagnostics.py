@@ -198,6 +198,15 @@ def _wgc_available():
     return False
 
 
+def _desktop_duplication_available():
+    """Whether the optional dxcam (DXGI Desktop Duplication) backend exists."""
+    try:
+        import importlib.util
+        return importlib.util.find_spec("dxcam") is not None
+    except Exception:
+        return False
+
+
 def collect_versions():
     """Return the allowlisted runtime manifest."""
     info = {
@@ -207,6 +216,7 @@ def collect_versions():
         "sqlite": sqlite3.sqlite_version,
         "frozen": bool(getattr(sys, "frozen", False)),
         "windows_graphics_capture": _wgc_available(),
+        "desktop_duplication": _desktop_duplication_available(),
     }
     try:
         from PyQt5.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
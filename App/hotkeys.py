@@ -5,8 +5,13 @@ Windows processes them. This is the same approach Greenshot uses, and is
 required because Windows 10/11 reserves PrintScreen for Snipping Tool,
 making RegisterHotKey fail with error 1409.
 
-The LL hook runs in the thread that installed it (which must pump messages),
-and we use a signal bridge to dispatch callbacks to the Qt main thread.
+Only PrintScreen bindings need the hook. Other bindings are registered with
+RegisterHotKey on the same thread, so Windows posts WM_HOTKEY for the exact
+combo instead of running the hook for every keystroke; when no PrintScreen
+binding is configured no hook is installed at all.
+
+The hook/hotkeys live on a thread that pumps messages, and we use a signal
+bridge to dispatch callbacks to the Qt main thread.
 """
 
 import sys
@@ -25,6 +30,8 @@ WM_KEYDOWN = 0x0100
 WM_KEYUP = 0x0101
 WM_SYSKEYDOWN = 0x0104
 WM_SYSKEYUP = 0x0105
+WM_HOTKEY = 0x0312
+MOD_NOREPEAT = 0x4000
 VK_SNAPSHOT = 0x2C
 VK_LSHIFT = 0xA0
 VK_RSHIFT = 0xA1
@@ -38,7 +45,8 @@ VK_MENU = 0x12
 VK_LWIN = 0x5B
 VK_RWIN = 0x5C
 
-# Modifier bit flags (our own, not Windows MOD_ flags)
+# Modifier bit flags (our own, but numerically equal to the Windows MOD_ALT /
+# MOD_CONTROL / MOD_SHIFT flags that RegisterHotKey takes)
 MOD_NONE = 0
 MOD_ALT = 1
 MOD_CTRL = 2
@@ -83,13 +91,16 @@ class _HotkeyBridge(QObject):
 
 class HotkeyManager:
     """
-    Global hotkey manager using WH_KEYBOARD_LL low-level hook.
-    Intercepts keys before Windows Snipping Tool can claim them.
+    Global hotkey manager using WH_KEYBOARD_LL low-level hook for PrintScreen
+    (intercepted before Windows Snipping Tool can claim it) and RegisterHotKey
+    for every other binding.
     """
 
     def __init__(self):
         self._callbacks = {}   # combo_str -> callable
         self._bindings = {}    # (modifiers, vk) -> combo_str
+        self._hook_bindings = {}   # subset the LL hook must match
+        self._hook_vks = frozenset()
         self._thread = None
         self._running = False
         self._hook = None
@@ -173,6 +184,18 @@ class HotkeyManager:
                 return MOD_NONE, None
         return modifiers, vk
 
+    def _partition_bindings(self):
+        """Split bindings into (hook, RegisterHotKey) dicts.
+
+        PrintScreen is reserved by Windows (RegisterHotKey error 1409), so
+        only it goes through the keyboard hook.
+        """
+        hook, registered = {}, {}
+        for binding, combo in self._bindings.items():
+            target = hook if binding[1] == VK_SNAPSHOT else registered
+            target[binding] = combo
+        return hook, registered
+
     def start(self):
         if sys.platform != 'win32' or not self._bindings:
             return True
@@ -216,7 +239,8 @@ class HotkeyManager:
         return mods
 
     def _hook_thread(self):
-        """Install the low-level keyboard hook and pump messages."""
+        """Register thread hotkeys, install the low-level keyboard hook if a
+        binding needs it, and pump messages."""
         # Use WinDLL with use_last_error for reliable error reporting,
         # and explicitly declare every function signature so ctypes
         # marshals arguments correctly (this is the fix for error 126).
@@ -258,15 +282,37 @@ class HotkeyManager:
         user32.GetAsyncKeyState.argtypes = [ctypes.c_int]
         user32.GetAsyncKeyState.restype = ctypes.c_short
 
+        user32.RegisterHotKey.argtypes = [
+            wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+        user32.RegisterHotKey.restype = wintypes.BOOL
+        user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+        user32.UnregisterHotKey.restype = wintypes.BOOL
+
         # Store user32 ref for use in modifier check and CallNextHookEx
         self._user32 = user32
 
+        # Thread-owned hotkeys (hwnd NULL): WM_HOTKEY lands in this thread's
+        # queue with the id in wParam. A combo another app already owns
+        # falls back to the hook.
+        hook_bindings, registered = self._partition_bindings()
+        hotkey_ids = {}
+        for (mods, vk), combo in registered.items():
+            hotkey_id = len(hotkey_ids) + 1
+            if user32.RegisterHotKey(None, hotkey_id, mods | MOD_NOREPEAT, vk):
+                hotkey_ids[hotkey_id] = combo
+            else:
+                log.info("RegisterHotKey failed for %s (error %d); using the "
+                         "keyboard hook", combo, ctypes.get_last_error())
+                hook_bindings[(mods, vk)] = combo
+        self._hook_bindings = hook_bindings
+        self._hook_vks = frozenset(vk for _mods, vk in hook_bindings)
+
         def ll_keyboard_proc(nCode, wParam, lParam):
             if nCode >= 0 and wParam in (WM_KEYDOWN, WM_SYSKEYDOWN):
                 vk = lParam.contents.vkCode
-                if vk not in (VK_SHIFT, VK_LSHIFT, VK_RSHIFT,
-                              VK_CONTROL, VK_LCONTROL, VK_RCONTROL,
-                              VK_MENU, VK_LMENU, VK_RMENU):
+                # Cheap set test first: this runs for every key system-wide,
+                # and only bound keys need the modifier-state queries below.
+                if vk in self._hook_vks:
                     gas = user32.GetAsyncKeyState
                     # Bindings can never include the Win key, so a held Win
                     # key means a DIFFERENT shortcut (e.g. Win+PrtSc =
@@ -275,13 +321,50 @@ class HotkeyManager:
                     win_held = (gas(VK_LWIN) & 0x8000) or (gas(VK_RWIN) & 0x8000)
                     if not win_held:
                         mods = self._get_active_modifiers()
-                        combo = self._bindings.get((mods, vk))
+                        combo = self._hook_bindings.get((mods, vk))
                         if combo and self._bridge:
                             self._bridge.fired.emit(combo)
                             return 1  # Swallow the key
 
             return user32.CallNextHookEx(self._hook, nCode, wParam, lParam)
 
+        if hook_bindings:
+            if not self._install_hook(user32, kernel32, ll_keyboard_proc):
+                for hotkey_id in hotkey_ids:
+                    user32.UnregisterHotKey(None, hotkey_id)
+                return
+        elif not hotkey_ids:
+            self._startup_error = "no global shortcut could be registered"
+            return
+
+        # Do not tell the controller registration succeeded until Windows has
+        # actually returned a live hook handle / hotkey registration.
+        # Thread.start() alone only proves that a Python thread was created.
+        self._startup_event.set()
+
+        # Message pump -- required for LL hooks and thread hotkeys to work
+        msg = wintypes.MSG()
+        while self._running:
+            result = user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
+            if result == 0 or result == -1:
+                break
+            if msg.message == WM_HOTKEY:
+                combo = hotkey_ids.get(msg.wParam)
+                if combo and self._bridge:
+                    self._bridge.fired.emit(combo)
+                continue
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        # Cleanup
+        for hotkey_id in hotkey_ids:
+            user32.UnregisterHotKey(None, hotkey_id)
+        if self._hook:
+            user32.UnhookWindowsHookEx(self._hook)
+            self._hook = None
+
+    def _install_hook(self, user32, kernel32, ll_keyboard_proc):
+        """Install the WH_KEYBOARD_LL hook on the calling thread."""
         # Must keep a reference to prevent GC
         self._hook_proc = HOOKPROC(ll_keyboard_proc)
 
@@ -316,25 +399,8 @@ class HotkeyManager:
         if not self._hook:
             err = ctypes.get_last_error()
             self._startup_error = f"keyboard hook installation failed (error {err})"
-            return
-
-        # Do not tell the controller registration succeeded until Windows has
-        # actually returned a live hook handle. Thread.start() alone only
-        # proves that a Python thread was created.
-        self._startup_event.set()
-
-        # Message pump -- required for LL hooks to work
-        msg = wintypes.MSG()
-        while self._running:
-            result = user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
-            if result == 0 or result == -1:
-                break
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
-
-        # Cleanup
-        user32.UnhookWindowsHookEx(self._hook)
-        self._hook = None
+            return False
+        return True
 
     def stop(self):
         """Stop the hook thread. Safe to call before start(); a new manager
@@ -2,12 +2,17 @@
 SwiftShot Logging Module
 Provides a rotating file logger writing to %APPDATA%/SwiftShot/swiftshot.log.
 All modules should import `log` and use log.info(), log.warning(), log.error().
+
+Records are handed to a QueueListener thread, so the rollover check and the
+file write never block the GUI thread mid-capture.
 """
 
+import atexit
 import os
+import queue
 import sys
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def _get_log_dir():
@@ -28,6 +33,7 @@ def setup_logger():
         return logger
 
     logger.setLevel(logging.DEBUG)
+    handlers = []
 
     # File handler: rotating, 2 MB max, keep 3 backups
     log_path = os.path.join(_get_log_dir(), "swiftshot.log")
@@ -42,7 +48,7 @@ def setup_logger():
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         fh.setFormatter(fmt)
-        logger.addHandler(fh)
+        handlers.append(fh)
     except Exception:
         pass
 
@@ -53,7 +59,15 @@ def setup_logger():
         ch.setFormatter(logging.Formatter(
             "[%(levelname)-7s] %(funcName)s: %(message)s"
         ))
-        logger.addHandler(ch)
+        handlers.append(ch)
+
+    if handlers:
+        records = queue.SimpleQueue()
+        listener = QueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        # Drains queued records (e.g. a crash traceback) before exit.
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(records))
 
     return logger
 
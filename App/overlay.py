@@ -9,7 +9,7 @@ dimension display, edge snapping, Space to switch to window mode.
 
 from PyQt5.QtWidgets import QWidget, QApplication
 from PyQt5.QtGui import (
-    QPainter, QColor, QPen, QPixmap, QFont, QPainterPath, QPalette
+    QPainter, QColor, QPen, QPixmap, QImage, QFont, QPainterPath, QPalette
 )
 from PyQt5.QtCore import Qt, QRect, QPoint, QTimer, pyqtSignal
 
@@ -41,30 +41,8 @@ class RegionSelector(QWidget):
 
     def __init__(self, screenshot: QPixmap, mode="rectangle", parent=None):
         super().__init__(parent)
-        self.screenshot = screenshot
-        # Cache the QImage once: converting the full multi-monitor pixmap
-        # on every repaint (for the color readout) is a large copy.
-        self._screenshot_image = screenshot.toImage()
-        self.mode = mode
-        self.selecting = False
-        self.start_pos = QPoint()
-        self.end_pos = QPoint()
-        self.current_pos = QPoint()
         self._generation = 0
-
-        # Freehand
-        self.freehand_points = []
-
-        # Aspect lock (R-22): index into ASPECT_PRESETS; ratio is width/height.
-        self._aspect_index = 0
-        self.aspect_ratio = None
-
-        # Edge snapping
-        self._snap_enabled = True
-        self._snap_edges_h = []  # horizontal edges (y values)
-        self._snap_edges_v = []  # vertical edges (x values)
-        self._snapped_x = None
-        self._snapped_y = None
+        self._clear_selection_state(screenshot, mode)
 
         # Color readout
         self._show_color = True
@@ -97,9 +75,6 @@ class RegionSelector(QWidget):
         self.setCursor(Qt.CrossCursor)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
-        self.setAccessibleName(
-            "Freehand capture region" if mode == self.MODE_FREEHAND
-            else "Rectangular capture region")
         self.setAccessibleDescription(
             "Move the crosshair with the arrow keys. Press Enter to start, "
             "resize with arrows (Shift = coarse), Ctrl+arrows to move the whole "
@@ -107,12 +82,7 @@ class RegionSelector(QWidget):
             "lock, then press Enter to capture. Escape cancels; Space switches "
             "to window capture; S toggles snapping.")
 
-        geo = virtual_geometry()
-        self._desktop_geo = geo
-        self.setFixedSize(geo.width(), geo.height())
-        self.move(geo.x(), geo.y())
-        self.current_pos = QPoint(max(0, self.width() // 2),
-                                  max(0, self.height() // 2))
+        self._fit_desktop()
 
         try:
             from theme import is_high_contrast_enabled
@@ -140,6 +110,62 @@ class RegionSelector(QWidget):
         # Pre-detect window edges for snapping
         self._detect_snap_edges()
 
+    def _clear_selection_state(self, screenshot, mode):
+        self.screenshot = screenshot
+        # Cache the QImage once: converting the full multi-monitor pixmap
+        # on every repaint (for the color readout) is a large copy.
+        self._screenshot_image = screenshot.toImage()
+        self.mode = mode
+        self.selecting = False
+        self.start_pos = QPoint()
+        self.end_pos = QPoint()
+        self.current_pos = QPoint()
+
+        # Freehand
+        self.freehand_points = []
+
+        # Aspect lock (R-22): index into ASPECT_PRESETS; ratio is width/height.
+        self._aspect_index = 0
+        self.aspect_ratio = None
+
+        # Edge snapping
+        self._snap_enabled = True
+        self._snap_edges_h = []  # horizontal edges (y values)
+        self._snap_edges_v = []  # vertical edges (x values)
+        self._snapped_x = None
+        self._snapped_y = None
+
+        self.setAccessibleName(
+            "Freehand capture region" if mode == self.MODE_FREEHAND
+            else "Rectangular capture region")
+
+    def _fit_desktop(self):
+        geo = virtual_geometry()
+        self._desktop_geo = geo
+        self.setFixedSize(geo.width(), geo.height())
+        self.move(geo.x(), geo.y())
+        self.current_pos = QPoint(max(0, self.width() // 2),
+                                  max(0, self.height() // 2))
+
+    def reset(self, screenshot: QPixmap, mode="rectangle"):
+        """Reuse this hidden overlay for another selection.
+
+        Swaps the frozen desktop and clears all selection state, so a
+        Region <-> Window toggle does not rebuild a desktop-sized widget and
+        its backing store. Pending deferred emits are invalidated.
+        """
+        self._generation += 1
+        self._clear_selection_state(screenshot, mode)
+        self._fit_desktop()
+        self._detect_snap_edges()
+        self.update()
+
+    def release(self):
+        """Drop the frozen desktop while this overlay waits to be reused."""
+        self._generation += 1
+        self.screenshot = QPixmap()
+        self._screenshot_image = QImage()
+
     def _detect_snap_edges(self):
         """Detect window edges for smart snapping."""
         import sys
@@ -1,14 +1,13 @@
 """
 SwiftShot Update Checker
-Checks GitHub releases API in a background thread.
+Checks GitHub releases API with an asynchronous QNetworkAccessManager request.
 Shows a tray notification if a newer version is available.
 """
 
 import json
 import re
-import urllib.request
-import urllib.error
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QUrl, pyqtSignal
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 
 from logger import log
 from config import config
@@ -35,25 +34,52 @@ def _parse_version(v):
     return tuple(parts[:3])
 
 
-class UpdateChecker(QThread):
-    """Background thread that checks GitHub for new releases."""
+class UpdateChecker(QObject):
+    """Checks GitHub for new releases without a dedicated thread; the GET
+    runs on Qt's network stack and finishes through the event loop."""
 
     update_available = pyqtSignal(str, str)  # (new_version, download_url)
     check_complete = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._nam = QNetworkAccessManager(self)
+        self._reply = None
+        self._cancelled = False
 
-    def run(self):
+    def check(self):
+        """Start the request; returns immediately."""
+        request = QNetworkRequest(QUrl(RELEASES_URL))
+        request.setRawHeader(b"Accept", b"application/vnd.github.v3+json")
+        request.setRawHeader(b"User-Agent", b"SwiftShot-UpdateChecker")
+        request.setTransferTimeout(UPDATE_TIMEOUT_SECONDS * 1000)
+        self._cancelled = False
+        self._reply = self._nam.get(request)
+        self._reply.finished.connect(self._on_reply_finished)
+
+    def cancel(self):
+        """Abort an in-flight check; nothing is emitted afterwards."""
+        self._cancelled = True
+        if self._reply is not None:
+            self._reply.abort()
+
+    def _on_reply_finished(self):
+        reply, self._reply = self._reply, None
+        try:
+            if self._cancelled:
+                return
+            if reply.error() != QNetworkReply.NoError:
+                log.warning(f"Update check failed (network): {reply.errorString()}")
+                return
+            self.handle_payload(bytes(reply.read(MAX_RESPONSE_BYTES + 1)))
+        finally:
+            reply.deleteLater()
+            self.check_complete.emit()
+
+    def handle_payload(self, payload):
+        """Validate a releases/latest response body and emit update_available
+        when it names a newer version."""
         try:
-            req = urllib.request.Request(
-                RELEASES_URL,
-                headers={"Accept": "application/vnd.github.v3+json",
-                         "User-Agent": "SwiftShot-UpdateChecker"}
-            )
-            with urllib.request.urlopen(
-                    req, timeout=UPDATE_TIMEOUT_SECONDS) as resp:
-                payload = resp.read(MAX_RESPONSE_BYTES + 1)
             if len(payload) > MAX_RESPONSE_BYTES:
                 raise ValueError("GitHub release response exceeded 1 MiB")
             data = json.loads(payload.decode('utf-8'))
@@ -78,15 +104,11 @@ class UpdateChecker(QThread):
             remote = _parse_version(tag)
             local = _parse_version(config.APP_VERSION)
 
-            if remote > local and not self.isInterruptionRequested():
+            if remote > local and not self._cancelled:
                 log.info(f"Update available: {tag} (current: {config.APP_VERSION})")
                 self.update_available.emit(tag, html_url)
             else:
                 log.info(f"Up to date (current: {config.APP_VERSION}, latest: {tag})")
 
-        except urllib.error.URLError as e:
-            log.warning(f"Update check failed (network): {e}")
         except Exception as e:
             log.warning(f"Update check failed: {e}")
-        finally:
-            self.check_complete.emit()
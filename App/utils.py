@@ -161,16 +161,23 @@ def qpixmap_to_pil(pixmap):
     ).copy()
 
 
-def pil_to_qpixmap(pil_image):
-    """Convert a Pillow image to a QPixmap."""
-    from PyQt5.QtGui import QImage, QPixmap
+def pil_to_qimage(pil_image):
+    """Convert a Pillow image to a detached QImage (safe off the GUI thread)."""
+    from PyQt5.QtGui import QImage
 
     image = pil_image.convert("RGBA")
     data = image.tobytes("raw", "RGBA")
     qimage = QImage(
         data, image.width, image.height, 4 * image.width, QImage.Format_RGBA8888
     )
-    return QPixmap.fromImage(qimage.copy())
+    return qimage.copy()
+
+
+def pil_to_qpixmap(pil_image):
+    """Convert a Pillow image to a QPixmap."""
+    from PyQt5.QtGui import QPixmap
+
+    return QPixmap.fromImage(pil_to_qimage(pil_image))
 
 
 def apply_beautification_preset(pixmap, preset_name):
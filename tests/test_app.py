@@ -1,3 +1,7 @@
+from types import SimpleNamespace
+
+import pytest
+from PyQt5.QtCore import QRect
 from PyQt5.QtGui import QColor, QPixmap
 
 
@@ -258,6 +262,40 @@ def test_saved_capture_is_not_misreported_when_path_copy_fails(
     assert notices[0][2]["required"] is True
 
 
+def test_direct_save_creates_output_folder_once(qapp, monkeypatch, tmp_path):
+    import app as app_module
+    import utils
+    from app import SwiftShotApp
+    from config import config
+
+    destination = tmp_path / "shots" / "capture.png"
+    controller = SwiftShotApp(qapp)
+    created = []
+    real_makedirs = app_module.os.makedirs
+    monkeypatch.setattr(config, "COPY_PATH_TO_CLIPBOARD", False)
+    monkeypatch.setattr(config, "get_filename", lambda **_kwargs: str(destination))
+    monkeypatch.setattr(utils, "save_pixmap", lambda *_args: True)
+    monkeypatch.setattr(
+        app_module.os, "makedirs",
+        lambda path, **kwargs: (created.append(path),
+                                real_makedirs(path, **kwargs)))
+    monkeypatch.setattr(controller, "_notify", lambda *_args, **_kwargs: None)
+    pixmap = QPixmap(2, 2)
+    pixmap.fill(QColor("green"))
+
+    controller._save_directly(pixmap)
+    controller._save_directly(pixmap)
+
+    assert created == [str(destination.parent)]
+
+    monkeypatch.setattr(utils, "save_pixmap", lambda *_args: False)
+    controller._save_directly(pixmap)   # failed save forgets the folder
+    monkeypatch.setattr(utils, "save_pixmap", lambda *_args: True)
+    controller._save_directly(pixmap)
+
+    assert len(created) == 2
+
+
 def test_ocr_worker_emits_ocr_file_result(qapp, monkeypatch):
     """OCR now runs off the GUI thread; the worker returns ocr_file's text."""
     import ocr
@@ -290,6 +328,85 @@ def test_update_history_ocr_writes_row(qapp, tmp_path, monkeypatch):
     assert any(e["ocr_text"] == "hello world" for e in entries)
 
 
+def test_history_save_task_indexes_image_off_gui_thread(qapp, tmp_path, monkeypatch):
+    import capture_history
+    from app import _HistorySaveTask
+    config = capture_history.config
+
+    monkeypatch.setattr(config, "CAPTURE_HISTORY_ENABLED", True)
+    monkeypatch.setattr(config, "CAPTURE_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "CAPTURE_HISTORY_MAX", 50)
+    px = QPixmap(4, 4)
+    px.fill(QColor(4, 5, 6))
+    task = _HistorySaveTask(px.toImage())
+    saved = []
+    task.signals.done.connect(saved.append)
+    task.run()   # execute synchronously on this thread
+
+    assert saved and saved[0]
+    entries = capture_history._history_entries(str(tmp_path))
+    assert [e["path"] for e in entries] == saved
+
+
+def test_history_save_refreshes_open_history_dialog(qapp, monkeypatch):
+    from app import SwiftShotApp, config
+
+    monkeypatch.setattr(config, "CAPTURE_HISTORY_AUTO_OCR", False)
+    controller = SwiftShotApp(qapp)
+    reloads = []
+    controller._history_dialog = SimpleNamespace(
+        isVisible=lambda: True, _load_history=lambda: reloads.append(1))
+
+    controller._on_history_saved("")
+    controller._on_history_saved("C:/history/capture.png")
+
+    assert reloads == [1]
+
+
+def test_history_image_is_decoded_on_pool_and_opened_on_gui_thread(
+        qapp, tmp_path, monkeypatch):
+    from PyQt5.QtCore import QThreadPool
+    from app import SwiftShotApp
+
+    path = tmp_path / "capture.png"
+    px = QPixmap(6, 3)
+    px.fill(QColor(7, 8, 9))
+    assert px.save(str(path), "PNG")
+    controller = SwiftShotApp(qapp)
+    opened = []
+    monkeypatch.setattr(controller, "_open_editor", opened.append)
+
+    controller._open_history_image(str(path))
+    assert QThreadPool.globalInstance().waitForDone(5000)
+    qapp.processEvents()
+
+    assert [(p.width(), p.height()) for p in opened] == [(6, 3)]
+    assert controller._pool_tasks == []
+
+
+def test_monitor_capture_uses_cached_screen_list(qapp, monkeypatch):
+    import capture
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    screen = qapp.primaryScreen()
+    controller._refresh_screens()
+    assert controller._screens == tuple(qapp.screens())
+    controller._refresh_screens(removed=screen)
+    assert screen not in controller._screens
+
+    controller._screens = (screen,)
+    requested = []
+    monkeypatch.setattr(
+        capture.CaptureManager, "capture_monitor",
+        staticmethod(lambda index, s=None: requested.append((index, s))))
+    monkeypatch.setattr(controller, "_finish_monitor_capture",
+                        lambda index, shot: None)
+    controller._do_capture_monitor(0)
+
+    assert requested == [(0, screen)]
+
+
 def test_new_delayed_capture_invalidates_older_callback(qapp, monkeypatch):
     import app as app_module
     from app import SwiftShotApp
@@ -313,6 +430,149 @@ def test_new_delayed_capture_invalidates_older_callback(qapp, monkeypatch):
     assert fired == ["new"]
 
 
+def test_resolved_icon_path_skips_candidate_scan(qapp, tmp_path, monkeypatch):
+    import app as app_module
+    from app import SwiftShotApp
+
+    icon_path = tmp_path / "swiftshot.png"
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(QColor(1, 2, 3))
+    assert pixmap.save(str(icon_path), "PNG")
+    monkeypatch.setattr(app_module, "_ICON_CANDIDATES",
+                        (str(tmp_path / "missing.ico"), str(icon_path)))
+    monkeypatch.setattr(SwiftShotApp, "_cached_icon_path", None)
+    controller = SwiftShotApp.__new__(SwiftShotApp)
+
+    assert not controller._load_ico_file().isNull()
+    assert SwiftShotApp._cached_icon_path == str(icon_path)
+    monkeypatch.setattr(app_module.os.path, "isfile",
+                        lambda _path: pytest.fail("candidates rescanned"))
+    assert not controller._load_ico_file().isNull()
+
+
+def test_fallback_icon_is_drawn_once(qapp, tmp_path, monkeypatch):
+    import app as app_module
+    from app import SwiftShotApp
+
+    drawn = []
+    real_draw = app_module._draw_fallback_icon
+    monkeypatch.setattr(SwiftShotApp, "_fallback_icon", None)
+    monkeypatch.setattr(
+        app_module, "_draw_fallback_icon",
+        lambda: drawn.append(1) or real_draw())
+    monkeypatch.setattr(app_module.config, "_config_dir", str(tmp_path))
+    monkeypatch.setattr(app_module.os.path, "isfile", lambda _path: False)
+    controller = SwiftShotApp.__new__(SwiftShotApp)
+    monkeypatch.setattr(controller, "_load_ico_file", lambda: None)
+
+    assert not controller._create_app_icon().isNull()
+    assert not controller._create_app_icon().isNull()
+    assert drawn == [1]
+
+
+def test_superseded_desktop_grab_is_dropped(qapp, monkeypatch):
+    """The grab now lands asynchronously; a newer capture must win."""
+    import capture
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    full = QPixmap(4, 4)
+    full.fill(QColor(1, 2, 3))
+    monkeypatch.setattr(capture.CaptureManager, "desktop_pixmap",
+                        staticmethod(lambda image: full))
+    ready = []
+    generation = controller._begin_capture_operation()
+
+    controller._on_full_ready(None, generation, ready.append, "failed")
+    controller._begin_capture_operation()
+    controller._on_full_ready(None, generation, ready.append, "failed")
+
+    assert ready == [full]
+
+
+def test_capture_menu_is_posted_without_fixed_delay(qapp, monkeypatch):
+    import app as app_module
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    delays = []
+    monkeypatch.setattr(
+        app_module.QTimer,
+        "singleShot",
+        lambda delay, _callback: delays.append(delay),
+    )
+
+    controller.show_capture_menu()
+
+    assert delays == [0]
+
+
+def test_lazy_capture_classes_are_imported_once(monkeypatch):
+    import app as app_module
+    import capture
+
+    monkeypatch.setattr(app_module, "_lazy_attrs", {})
+    imports = []
+    real_import = app_module.importlib.import_module
+    monkeypatch.setattr(
+        app_module.importlib,
+        "import_module",
+        lambda name: imports.append(name) or real_import(name),
+    )
+
+    assert app_module._capture_manager() is capture.CaptureManager
+    assert app_module._capture_manager() is capture.CaptureManager
+    assert imports == ["capture"]
+
+
+def test_last_region_parse_is_cached_until_config_changes(qapp, monkeypatch):
+    from app import SwiftShotApp
+    from config import config
+
+    controller = SwiftShotApp(qapp)
+    monkeypatch.setattr(config, "save", lambda: True)
+    monkeypatch.setattr(config, "LAST_REGION", "")
+
+    controller._remember_last_region(QRect(1, 2, 30, 40))
+    assert config.LAST_REGION == "1,2,30,40"
+    assert controller._last_region_rect() == QRect(1, 2, 30, 40)
+
+    monkeypatch.setattr(config, "LAST_REGION", "5,6,7,8")
+    assert controller._last_region_rect() == QRect(5, 6, 7, 8)
+    monkeypatch.setattr(config, "LAST_REGION", "5,6,oops")
+    assert controller._last_region_rect() is None
+
+
+def test_region_overlay_is_reset_and_rewired_for_the_next_capture(
+        qapp, monkeypatch):
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    selections = []
+    monkeypatch.setattr(
+        controller, "_on_region_selected",
+        lambda full, rect, ocr, g, o: selections.append((full, g)))
+    first_full = QPixmap(8, 8)
+    second_full = QPixmap(8, 8)
+
+    first = controller._build_region_overlay(first_full, "freehand")
+    controller._close_overlay(first)
+    assert controller._overlay is None
+    assert first.screenshot.isNull()
+    assert first._full_screenshot is None
+    first.region_selected.emit(QRect(0, 0, 4, 4))   # slots were cut on close
+    assert selections == []
+
+    controller._capture_generation += 1
+    second = controller._build_region_overlay(second_full, "rectangle")
+    second.region_selected.emit(QRect(0, 0, 4, 4))
+
+    assert second is first
+    assert second.mode == "rectangle"
+    assert selections == [(second_full, controller._capture_generation)]
+    controller._close_overlay(second)
+
+
 def test_diagnostics_export_previews_privacy_categories_before_writing(
         qapp, monkeypatch):
     import app as app_module
@@ -505,6 +765,84 @@ def test_clipboard_watcher_toggle_rolls_back_when_config_cannot_save(
     assert notices[0][1]["required"] is True
 
 
+def test_clipboard_watcher_follows_data_changed_signal(qapp, monkeypatch):
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    changes = []
+    monkeypatch.setattr(controller, "_on_clipboard_changed",
+                        lambda: changes.append(1))
+
+    controller._start_clipboard_watcher()
+    controller._start_clipboard_watcher()   # idempotent: one connection
+    qapp.clipboard().dataChanged.emit()
+    controller._stop_clipboard_watcher()
+    qapp.clipboard().dataChanged.emit()
+
+    assert changes == [1]
+
+
+def test_repeated_clipboard_notification_skips_clipboard_read(qapp, monkeypatch):
+    import app as app_module
+    from app import SwiftShotApp
+
+    class _Clipboard:
+        def __init__(self):
+            self.reads = 0
+
+        def ownsClipboard(self):
+            return False
+
+        def mimeData(self):
+            self.reads += 1
+            return None
+
+    clipboard = _Clipboard()
+    monkeypatch.setattr(app_module.QApplication, "clipboard", lambda: clipboard)
+    monkeypatch.setattr(app_module.time, "monotonic", lambda: 100.0)
+    controller = SwiftShotApp.__new__(SwiftShotApp)
+
+    controller._last_clipboard_change = 99.8
+    controller._on_clipboard_changed()
+    assert clipboard.reads == 0
+
+    controller._last_clipboard_change = 0.0
+    controller._on_clipboard_changed()
+    assert clipboard.reads == 1
+
+
+def test_clipboard_image_is_read_from_fetched_mime_data(qapp, monkeypatch):
+    import app as app_module
+    from app import SwiftShotApp
+    from PyQt5.QtCore import QMimeData
+    from PyQt5.QtGui import QImage
+
+    image = QImage(6, 4, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    mime = QMimeData()
+    mime.setImageData(image)
+
+    class _Clipboard:
+        def ownsClipboard(self):
+            return False
+
+        def mimeData(self):
+            return mime
+
+        def pixmap(self):
+            raise AssertionError("clipboard fetched twice")
+
+    monkeypatch.setattr(app_module.QApplication, "clipboard", lambda: _Clipboard())
+    controller = SwiftShotApp.__new__(SwiftShotApp)
+    controller._last_clipboard_change = 0.0
+    opened = []
+    controller._open_editor = opened.append
+
+    controller._on_clipboard_changed()
+
+    assert [(p.width(), p.height()) for p in opened] == [(6, 4)]
+
+
 def test_hotkey_registration_failure_cleans_up_partial_listener(
         qapp, monkeypatch):
     import hotkeys
@@ -526,3 +864,55 @@ def test_hotkey_registration_failure_cleans_up_partial_listener(
     assert controller._register_hotkeys() is False
     assert controller._hotkey_listener is None
     assert listener.stopped is True
+
+
+def test_tray_menu_is_built_from_spec(qapp):
+    from app import SwiftShotApp
+
+    controller = SwiftShotApp(qapp)
+    controller._create_tray_icon()
+    actions = controller._tray_menu.actions()
+    labels = [a.text().split("\t")[0] for a in actions if not a.isSeparator()]
+
+    assert labels[0] == "Capture Menu"
+    assert labels[-1] == "Exit"
+    assert "Export Diagnostics..." in labels
+    assert actions[-1] is controller._exit_action
+    assert actions[-2].isSeparator()
+    assert ("OCR Region", "CAPTURE_OCR_HOTKEY") in controller._tray_hotkey_actions
+
+
+def test_warm_imports_preload_capture_modules(monkeypatch):
+    import app as app_module
+
+    imported = []
+
+    def _import(name):
+        imported.append(name)
+        if name == "overlay":
+            raise ImportError("optional dependency missing")
+
+    monkeypatch.setattr(app_module.importlib, "import_module", _import)
+
+    app_module._warm_imports()   # a failing module doesn't stop the rest
+
+    assert tuple(imported) == app_module._WARM_IMPORT_MODULES
+
+
+def test_countdown_badge_is_reused_without_stale_callbacks(qapp, monkeypatch):
+    from app import SwiftShotApp
+    from config import config
+
+    controller = SwiftShotApp(qapp)
+    monkeypatch.setattr(config, "CAPTURE_DELAY_MS", 3000)
+    fired = []
+
+    controller._capture_with_delay(lambda: fired.append("first"))
+    first = controller._countdown
+    controller._capture_with_delay(lambda: fired.append("second"))
+
+    assert controller._countdown is first
+    assert first.isVisible()
+    first.countdown_finished.emit()
+    assert fired == ["second"]
+    first.hide()
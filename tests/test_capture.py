@@ -18,6 +18,16 @@ def test_crop_image_returns_intersection(qapp):
     assert cropped.height() == 40
 
 
+def test_crop_image_shares_pixels_for_full_rect(qapp):
+    pixmap = QPixmap(100, 80)
+    pixmap.fill(QColor("red"))
+
+    cropped = CaptureManager.crop_image(pixmap, QRect(-10, -10, 200, 200))
+
+    assert cropped is not pixmap
+    assert cropped.cacheKey() == pixmap.cacheKey()
+
+
 def test_crop_image_rejects_empty_intersection(qapp):
     pixmap = QPixmap(100, 80)
     pixmap.fill(QColor("red"))
@@ -100,6 +110,16 @@ def test_capture_rect_rejects_unsafe_dimensions_before_allocating(
     assert screens_called == []
 
 
+def test_cursor_shape_is_rendered_once_per_handle(qapp, monkeypatch):
+    shape = (QPixmap(4, 4).toImage(), (1, 2))
+    monkeypatch.setattr(CaptureManager, "_cursor_cache", {0x1234: shape})
+    monkeypatch.setattr(
+        CaptureManager, "_cursor_to_qimage",
+        staticmethod(lambda _handle: pytest.fail("cursor re-rendered")))
+
+    assert CaptureManager._cursor_shape(0x1234) is shape
+
+
 def test_cursor_to_qimage_none_handle(qapp):
     assert CaptureManager._cursor_to_qimage(None) is None
 
@@ -119,3 +139,157 @@ def test_cursor_to_qimage_renders_real_cursor_shapes(qapp, idc):
         img.pixelColor(x, y).alpha() > 200
         for y in range(img.height()) for x in range(img.width())
     )
+
+
+class _FakeDxcam:
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.created = []
+        self.regions = []
+
+    def create(self, output_idx=0, output_color="RGB"):
+        self.created.append((output_idx, output_color))
+        fake = self
+
+        class _Camera:
+            def grab(self, region=None):
+                fake.regions.append(region)
+                return fake.frames.pop(0) if fake.frames else None
+
+        return _Camera()
+
+
+def _bgra_frame(width, height, bgr):
+    import numpy as np
+
+    frame = np.zeros((height, width, 4), dtype=np.uint8)
+    frame[..., 0], frame[..., 1], frame[..., 2] = bgr
+    frame[..., 3] = 255
+    return frame
+
+
+@pytest.fixture
+def fresh_dxcam(monkeypatch):
+    monkeypatch.setattr(CaptureManager, "_dxcam_module", None)
+    monkeypatch.setattr(CaptureManager, "_dxcam_cameras", {})
+    monkeypatch.setattr(CaptureManager, "_dxcam_frames", {})
+
+
+def test_dxcam_grab_wraps_bgra_frame_and_caches_camera(
+        qapp, monkeypatch, fresh_dxcam):
+    fake = _FakeDxcam([_bgra_frame(8, 6, (255, 0, 0)),
+                       _bgra_frame(8, 6, (0, 0, 255))])
+    monkeypatch.setitem(sys.modules, "dxcam", fake)
+
+    first = CaptureManager._grab_dxcam(0)
+    second = CaptureManager._grab_dxcam(0)
+
+    assert (first.width(), first.height()) == (8, 6)
+    assert first.toImage().pixelColor(0, 0) == QColor("blue")
+    assert second.toImage().pixelColor(7, 5) == QColor("red")
+    assert fake.created == [(0, "BGRA")]
+
+
+def test_dxcam_unchanged_desktop_or_missing_package_falls_back(
+        qapp, monkeypatch, fresh_dxcam):
+    monkeypatch.setitem(sys.modules, "dxcam", _FakeDxcam([]))
+    assert CaptureManager._grab_dxcam(0) is None
+
+    monkeypatch.setattr(CaptureManager, "_dxcam_module", None)
+    monkeypatch.setattr(CaptureManager, "_dxcam_cameras", {})
+    monkeypatch.setitem(sys.modules, "dxcam", None)
+    assert CaptureManager._grab_dxcam(0) is None
+    assert CaptureManager._dxcam_module is False
+
+
+def test_dxcam_unchanged_desktop_reuses_last_full_frame(
+        qapp, monkeypatch, fresh_dxcam):
+    fake = _FakeDxcam([_bgra_frame(8, 6, (0, 0, 255))])
+    monkeypatch.setitem(sys.modules, "dxcam", fake)
+
+    first = CaptureManager._grab_dxcam_image(0)
+    again = CaptureManager._grab_dxcam_image(0)            # no new frame
+    box = CaptureManager._grab_dxcam_image(0, (2, 1, 6, 4))
+
+    assert again == first
+    assert (box.width(), box.height()) == (4, 3)
+    assert box.pixelColor(0, 0) == QColor("red")
+
+    fake.frames.append(_bgra_frame(4, 3, (0, 255, 0)))
+    CaptureManager._grab_dxcam_image(0, (2, 1, 6, 4))     # consumes changes
+    assert CaptureManager._grab_dxcam_image(0) is None
+
+
+def test_capture_monitor_rejects_mismatched_dxgi_output(
+        qapp, monkeypatch, fresh_dxcam):
+    import capture
+
+    class _Screen:
+        def geometry(self):
+            return QRect(0, 0, 20, 10)
+
+        def grabWindow(self, _window):
+            pixmap = QPixmap(20, 10)
+            pixmap.fill(QColor("green"))
+            return pixmap
+
+    monkeypatch.setattr(capture.sys, "platform", "win32")
+    monkeypatch.setattr(capture.QApplication, "screens", lambda: [_Screen()])
+    monkeypatch.setitem(
+        sys.modules, "dxcam", _FakeDxcam([_bgra_frame(8, 6, (0, 0, 255))]))
+
+    result = CaptureManager.capture_monitor(0)
+
+    assert result.toImage().pixelColor(0, 0) == QColor("green")
+    assert CaptureManager._last_screenshot_backend == "qt"
+
+
+def test_capture_region_grabs_only_the_requested_box(
+        qapp, monkeypatch, fresh_dxcam):
+    import capture
+
+    class _Screen:
+        def geometry(self):
+            return QRect(-100, 0, 200, 100)
+
+    monkeypatch.setattr(capture.sys, "platform", "win32")
+    monkeypatch.setattr(capture.QApplication, "screens", lambda: [_Screen()])
+    monkeypatch.setattr(capture, "virtual_geometry",
+                        lambda: QRect(-100, 0, 200, 100))
+    monkeypatch.setattr(capture.config, "CAPTURE_MOUSE_POINTER", False)
+    fake = _FakeDxcam([_bgra_frame(30, 20, (0, 255, 0))])
+    monkeypatch.setitem(sys.modules, "dxcam", fake)
+
+    pixmap = CaptureManager.capture_region(QRect(10, 5, 30, 20))
+
+    assert (pixmap.width(), pixmap.height()) == (30, 20)
+    assert fake.regions == [(10, 5, 40, 25)]
+    # A rect leaving the screen takes the full-grab-and-crop path.
+    assert CaptureManager.capture_region(QRect(190, 5, 30, 20)) is None
+    assert fake.regions == [(10, 5, 40, 25)]
+
+
+def test_capture_worker_emits_null_image_without_native_backend(qapp, monkeypatch):
+    """Off Windows the worker has nothing to grab; the GUI thread falls back."""
+    import capture
+    from capture import CaptureWorker
+
+    monkeypatch.setattr(capture.sys, "platform", "linux")
+    worker = CaptureWorker(1)
+    images = []
+    worker.image_ready.connect(images.append)
+    worker.run()   # execute synchronously on this thread
+
+    assert len(images) == 1 and images[0].isNull()
+
+
+@pytest.mark.skipif(sys.platform != "win32", reason="Win32 GDI capture")
+def test_gdi_capture_reuses_surface_until_released(qapp):
+    first = CaptureManager._capture_fullscreen_win32()
+    cached = dict(CaptureManager._gdi_cache)
+    second = CaptureManager._capture_fullscreen_win32()
+
+    assert not first.isNull() and second.size() == first.size()
+    assert CaptureManager._gdi_cache["hbmp"] == cached["hbmp"]
+    CaptureManager.release_gdi_cache()
+    assert CaptureManager._gdi_cache["size"] is None
@@ -169,6 +169,70 @@ def test_duplicate_content_file_not_rehashed_every_open(fresh_config, qapp, tmp_
         capture_history._index_file = real
 
 
+def test_history_scan_is_reused_until_folder_changes(
+        fresh_config, qapp, tmp_path, monkeypatch):
+    import os
+    capture_history = _load_capture_history(fresh_config, tmp_path)
+
+    Path(tmp_path, "a.png").write_bytes(b"x")
+    Path(tmp_path, "notes.txt").write_bytes(b"x")
+    Path(tmp_path, ".hidden.png").write_bytes(b"x")
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(capture_history.os, "scandir",
+                        lambda path: (scans.append(path), real_scandir(path))[1])
+
+    first = capture_history._history_files(str(tmp_path))
+    assert capture_history._history_files(str(tmp_path)) == first
+    assert [Path(p).name for p in first] == ["a.png"]
+    assert len(scans) == 1
+
+    Path(tmp_path, "b.jpg").write_bytes(b"x")
+    stamp = os.stat(tmp_path).st_mtime_ns + 1_000_000
+    os.utime(tmp_path, ns=(stamp, stamp))   # coarse-clock filesystems
+    names = sorted(Path(p).name for p in capture_history._history_files(str(tmp_path)))
+    assert names == ["a.png", "b.jpg"]
+    assert len(scans) == 2
+
+
+def test_history_entries_filter_missing_files_from_scan(
+        fresh_config, qapp, tmp_path, monkeypatch):
+    capture_history = _load_capture_history(fresh_config, tmp_path)
+
+    pixmap = QPixmap(8, 8)
+    pixmap.fill(QColor(4, 5, 6))
+    saved = capture_history.save_to_history(pixmap)
+    capture_history._history_entries(str(tmp_path))   # index once
+    real_exists = capture_history.os.path.exists
+
+    def exists(path):
+        assert not str(path).endswith(".png"), f"capture re-statted: {path}"
+        return real_exists(path)
+
+    monkeypatch.setattr(capture_history.os.path, "exists", exists)
+
+    entries = capture_history._history_entries(str(tmp_path))
+
+    assert [e["path"] for e in entries] == [saved]
+
+
+def test_safe_thumbnail_keeps_only_the_downscaled_pixmap(
+        fresh_config, qapp, tmp_path):
+    capture_history = _load_capture_history(fresh_config, tmp_path)
+    path = str(Path(tmp_path, "wide.png"))
+    source = QPixmap(1640, 480)
+    source.fill(QColor(1, 2, 3))
+    assert source.save(path, "PNG")
+
+    thumb, size = capture_history._safe_thumbnail(path)
+
+    assert size == (1640, 480)
+    assert (thumb.width(), thumb.height()) == (164, 48)
+    missing, missing_size = capture_history._safe_thumbnail(
+        str(Path(tmp_path, "gone.png")))
+    assert missing.isNull() and missing_size is None
+
+
 def test_history_hash_matches_file_without_whole_file_read(fresh_config, tmp_path):
     capture_history = _load_capture_history(fresh_config, tmp_path)
     path = tmp_path / "capture.png"
@@ -518,3 +582,21 @@ def test_history_copy_reports_busy_clipboard(
         assert "clipboard busy" in warnings[0][2]
     finally:
         dialog.close()
+
+
+def test_history_png_uses_fast_compression(fresh_config, qapp, tmp_path, monkeypatch):
+    capture_history = _load_capture_history(fresh_config, tmp_path)
+    qualities = []
+    real_bytes = capture_history._pixmap_png_bytes
+
+    def recording_bytes(pixmap, quality=-1):
+        qualities.append(quality)
+        return real_bytes(pixmap, quality)
+
+    monkeypatch.setattr(capture_history, "_pixmap_png_bytes", recording_bytes)
+    pixmap = QPixmap(8, 8)
+    pixmap.fill(QColor("teal"))
+
+    assert capture_history.save_to_history(pixmap)
+    # The full-size capture is encoded first; thumbnails keep the default.
+    assert qualities[0] == capture_history.HISTORY_PNG_QUALITY
@@ -177,6 +177,15 @@ def test_import_rejects_wrong_types_and_bad_enums(fresh_config, tmp_path):
     assert cfg.THEME == fresh_config.Config.THEME
 
 
+def test_output_format_is_stored_lowercase(fresh_config):
+    cfg = fresh_config.Config()
+    cfg.OUTPUT_FILE_FORMAT = "JPG"
+    cfg.save()
+
+    assert cfg.OUTPUT_FILE_FORMAT == "jpg"
+    assert fresh_config.Config().OUTPUT_FILE_FORMAT == "jpg"
+
+
 def test_recent_colors_reset_after_mutation(fresh_config):
     """add_recent_color used to mutate the class-level default list, which
     made Reset to Defaults unable to clear recent colors (regression)."""
@@ -76,3 +76,18 @@ def test_start_reports_hook_thread_initialization_failure(monkeypatch):
     assert manager.start() is False
     assert manager._thread is None
     assert manager._running is False
+
+
+def test_only_printscreen_bindings_need_the_keyboard_hook():
+    from hotkeys import HotkeyManager, MOD_CTRL, MOD_SHIFT, VK_SNAPSHOT
+
+    manager = HotkeyManager()
+    assert manager.register("Print", lambda: None)
+    assert manager.register("Ctrl+Print", lambda: None)
+    assert manager.register("Ctrl+Shift+F9", lambda: None)
+
+    hook, registered = manager._partition_bindings()
+
+    assert hook == {(0, VK_SNAPSHOT): "Print",
+                    (MOD_CTRL, VK_SNAPSHOT): "Ctrl+Print"}
+    assert registered == {(MOD_CTRL | MOD_SHIFT, 0x78): "Ctrl+Shift+F9"}
@@ -302,3 +302,11 @@ def test_icon_generator_writes_only_requested_destination(tmp_path):
 
     assert requested.read_bytes().startswith(b"\x00\x00\x01\x00")
     assert tracked.read_bytes() == b"tracked icon must remain unchanged"
+
+
+def test_logger_hands_records_to_background_listener():
+    from logging.handlers import QueueHandler
+
+    from logger import log
+
+    assert [type(h) for h in log.handlers] == [QueueHandler]
@@ -4,28 +4,12 @@ never an arbitrary URL from the API response (defense-in-depth)."""
 import json
 
 
-class _Resp:
-    def __init__(self, payload):
-        self._b = json.dumps(payload).encode()
-
-    def read(self, size=-1):
-        return self._b if size < 0 else self._b[:size]
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *a):
-        return False
-
-
 def _run_checker(qapp, monkeypatch, payload):
     import updater
-    monkeypatch.setattr(updater.urllib.request, "urlopen",
-                        lambda *a, **k: _Resp(payload))
     checker = updater.UpdateChecker()
     emitted = []
     checker.update_available.connect(lambda tag, url: emitted.append((tag, url)))
-    checker.run()
+    checker.handle_payload(json.dumps(payload).encode())
     return emitted
 
 
@@ -51,18 +35,11 @@ def test_legit_github_url_is_kept(qapp, monkeypatch):
 def test_update_response_is_size_bounded(qapp, monkeypatch):
     import updater
 
-    class _LargeResponse(_Resp):
-        def __init__(self):
-            self._b = b"x" * (updater.MAX_RESPONSE_BYTES + 1)
-
-    monkeypatch.setattr(
-        updater.urllib.request, "urlopen",
-        lambda *args, **kwargs: _LargeResponse())
     checker = updater.UpdateChecker()
     emitted = []
     checker.update_available.connect(lambda *args: emitted.append(args))
 
-    checker.run()
+    checker.handle_payload(b"x" * (updater.MAX_RESPONSE_BYTES + 1))
 
     assert emitted == []
 
@@ -79,3 +56,19 @@ def test_parse_version_preserves_patch_before_metadata():
     from updater import _parse_version
 
     assert _parse_version("v2.8.7+build.4") == (2, 8, 7)
+
+
+def test_cancelled_check_emits_nothing(qapp):
+    import updater
+
+    checker = updater.UpdateChecker()
+    emitted = []
+    checker.update_available.connect(lambda *args: emitted.append(args))
+
+    checker.cancel()
+    checker.handle_payload(json.dumps({
+        "tag_name": "v999.0.0",
+        "html_url": "https://github.com/SysAdminDoc/SwiftShot/releases",
+    }).encode())
+
+    assert emitted == []